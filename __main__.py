@@ -14,11 +14,16 @@ import asyncio
 import argparse
 import json
 import logging
+import os
 import sys
 import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+import orjson
+from pydantic import ValidationError
 
 from config import (
     HEADERS,
@@ -27,6 +32,7 @@ from config import (
     RATE_LIMIT_DELAY,
     HTTP_TIMEOUT,
     SELECTORS,
+    MAX_CONCURRENT_REQUESTS,
 )
 
 from scraper import (
@@ -44,6 +50,7 @@ from models import (
     TradingEconomicsOutput,
     MarketCategory,
     CountryCode,
+    set_scrape_timestamp,
 )
 
 from parsers.markets import (
@@ -57,6 +64,8 @@ from parsers.markets import (
 
 from parsers.macro import (
     parse_macro_indicators,
+    cached_macro_indicators,
+    cache_macro_indicators,
     parse_gdp_only,
     parse_inflation_only,
 )
@@ -90,16 +99,33 @@ DEFAULT_URLS = {
 }
 
 
-async def fetch_market_data(client: ScrapingClient, url_key: str) -> list:
+async def _run_parser(parser: Callable, html: str, executor: Optional[Executor] = None):
+    """Run a parser in the executor, or inline when none is given."""
+    if executor is None:
+        return parser(html)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parser, html)
+
+
+async def fetch_market_data(
+    client: ScrapingClient,
+    url_key: str,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    executor: Optional[Executor] = None,
+) -> list:
     """Fetch and parse market data for a category."""
     url = DEFAULT_URLS.get(url_key)
     if not url:
-        logger.warning(f"No URL configured for {url_key}")
+        logger.warning("No URL configured for %s", url_key)
         return []
     
     try:
-        logger.info(f"Fetching {url_key} data from {url}")
-        html = await client.scrape(url)
+        logger.info("Fetching %s data from %s", url_key, url)
+        if semaphore:
+            async with semaphore:
+                html = await client.scrape(url)
+        else:
+            html = await client.scrape(url)
         
         parser_map = {
             "forex": parse_forex,
@@ -112,18 +138,18 @@ async def fetch_market_data(client: ScrapingClient, url_key: str) -> list:
         
         parser = parser_map.get(url_key)
         if parser:
-            data = parser(html)
-            logger.info(f"Parsed {len(data)} {url_key} instruments")
+            data = await _run_parser(parser, html, executor)
+            logger.info("Parsed %d %s instruments", len(data), url_key)
             return data
     except ScraperError as e:
-        logger.error(f"Error fetching {url_key}: {e}")
+        logger.error("Error fetching %s: %s", url_key, e)
     except Exception as e:
-        logger.error(f"Unexpected error parsing {url_key}: {e}")
+        logger.error("Unexpected error parsing %s: %s", url_key, e)
     
     return []
 
 
-async def fetch_all_markets(client: ScrapingClient) -> dict:
+async def fetch_all_markets(client: ScrapingClient, executor: Optional[Executor] = None) -> dict:
     """Fetch all market data categories."""
     result = {
         "forex": [],
@@ -134,19 +160,23 @@ async def fetch_all_markets(client: ScrapingClient) -> dict:
         "stocks": [],
     }
     
-    # Fetch in parallel for efficiency
-    tasks = []
-    for url_key in result.keys():
-        task = asyncio.create_task(fetch_market_data(client, url_key))
-        tasks.append((url_key, task))
+    # Fetch in parallel, capping concurrent outbound connections
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(
+        *(fetch_market_data(client, url_key, semaphore, executor) for url_key in result),
+        return_exceptions=True,
+    )
     
-    for url_key, task in tasks:
-        result[url_key] = await task
+    for url_key, data in zip(list(result), results):
+        if isinstance(data, Exception):
+            logger.error("Unexpected error fetching %s: %s", url_key, data)
+            continue
+        result[url_key] = data
     
     return result
 
 
-async def fetch_macro_data(client: ScrapingClient) -> dict:
+async def fetch_macro_data(client: ScrapingClient, executor: Optional[Executor] = None) -> dict:
     """Fetch and parse macroeconomic indicators."""
     url = DEFAULT_URLS.get("macro")
     if not url:
@@ -154,23 +184,28 @@ async def fetch_macro_data(client: ScrapingClient) -> dict:
         return {}
     
     try:
-        logger.info(f"Fetching macro data from {url}")
+        logger.info("Fetching macro data from %s", url)
         html = await client.scrape(url)
-        data = parse_macro_indicators(html)
+        # Pool workers only live for one run, so the page cache is kept here in the parent
+        data = cached_macro_indicators(html)
+        if data is None:
+            data = await _run_parser(parse_macro_indicators, html, executor)
+            cache_macro_indicators(html, data)
         
         total = sum(len(v) for v in data.values())
-        logger.info(f"Parsed {total} macro indicators across {len(data)} countries")
+        logger.info("Parsed %d macro indicators across %d countries", total, len(data))
         return data
     except ScraperError as e:
-        logger.error(f"Error fetching macro data: {e}")
+        logger.error("Error fetching macro data: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error parsing macro: {e}")
-        logger.debug(traceback.format_exc())
+        logger.error("Unexpected error parsing macro: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
     
     return {}
 
 
-async def fetch_headlines(client: ScrapingClient) -> dict:
+async def fetch_headlines(client: ScrapingClient, executor: Optional[Executor] = None) -> dict:
     """Fetch and parse news headlines."""
     url = DEFAULT_URLS.get("news")
     if not url:
@@ -182,18 +217,19 @@ async def fetch_headlines(client: ScrapingClient) -> dict:
         }
     
     try:
-        logger.info(f"Fetching news from {url}")
+        logger.info("Fetching news from %s", url)
         html = await client.scrape(url)
-        data = parse_all_news_categories(html)
+        data = await _run_parser(parse_all_news_categories, html, executor)
         
         total = sum(len(v) for v in data.values())
-        logger.info(f"Parsed {total} news articles")
+        logger.info("Parsed %d news articles", total)
         return data
     except ScraperError as e:
-        logger.error(f"Error fetching news: {e}")
+        logger.error("Error fetching news: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error parsing news: {e}")
-        logger.debug(traceback.format_exc())
+        logger.error("Unexpected error parsing news: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
     
     return {
         "market_headlines": [],
@@ -202,9 +238,37 @@ async def fetch_headlines(client: ScrapingClient) -> dict:
     }
 
 
+def write_output_json(output: TradingEconomicsOutput, output_path: str) -> None:
+    """
+    Write output as indented JSON, serializing one record at a time.
+    
+    Avoids materializing the full model_dump() tree before writing.
+    
+    Args:
+        output: Pipeline output to serialize
+        output_path: Destination file path
+    """
+    with open(output_path, "wb") as f:
+        f.write(b"{")
+        for i, name in enumerate(TradingEconomicsOutput.model_fields):
+            value = getattr(output, name)
+            f.write(b"," if i else b"")
+            f.write(b"\n  " + orjson.dumps(name) + b": ")
+            if name in ("metadata", "errors"):
+                f.write(orjson.dumps(value))
+                continue
+            f.write(b"[")
+            for j, record in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                f.write(orjson.dumps(record.model_dump()))
+            f.write(b"\n  ]" if value else b"]")
+        f.write(b"\n}\n")
+
+
 async def run_pipeline(
     output_path: Optional[str] = None,
     verbose: bool = False,
+    strict: bool = False,
 ) -> TradingEconomicsOutput:
     """
     Run the complete scraping pipeline.
@@ -212,6 +276,7 @@ async def run_pipeline(
     Args:
         output_path: Optional path to save JSON output
         verbose: Enable debug logging
+        strict: Re-validate all parsed records before output
         
     Returns:
         TradingEconomicsOutput with all scraped data
@@ -220,6 +285,8 @@ async def run_pipeline(
         logging.getLogger().setLevel(logging.DEBUG)
     
     start_time = datetime.utcnow()
+    # Every record of this run carries the same scrape timestamp
+    set_scrape_timestamp(start_time)
     logger.info("=" * 50)
     logger.info("Trading Economics Scraper - Starting pipeline")
     logger.info("=" * 50)
@@ -227,11 +294,25 @@ async def run_pipeline(
     errors = []
     output = TradingEconomicsOutput()
     
+    # Parsing is CPU-bound; run it in worker processes so pages parse in parallel.
+    # Workers get the batch timestamp via the initializer (not inherited on spawn).
+    pool = ProcessPoolExecutor(
+        max_workers=min(len(DEFAULT_URLS), os.cpu_count() or 1),
+        initializer=set_scrape_timestamp,
+        initargs=(start_time,),
+    )
+    
     try:
         async with ScrapingClient() as client:
-            # Step 1: Fetch market data (all categories in parallel)
-            logger.info("\n[1/4] Fetching market data...")
-            markets = await fetch_all_markets(client)
+            # Steps 1-3 are independent: issue market, macro and news fetches together
+            logger.info("\n[1-3/4] Fetching market, macroeconomic and news data...")
+            markets, macro, news = await asyncio.gather(
+                fetch_all_markets(client, pool),
+                fetch_macro_data(client, pool),
+                fetch_headlines(client, pool),
+            )
+            
+            # Step 1: Market data
             output.forex = markets.get("forex", [])
             output.indices = markets.get("indices", [])
             output.commodities = markets.get("commodities", [])
@@ -239,34 +320,13 @@ async def run_pipeline(
             output.crypto = markets.get("crypto", [])
             output.stocks = markets.get("stocks", [])
             
-            # Step 2: Fetch macro data
-            logger.info("\n[2/4] Fetching macroeconomic data...")
-            macro = await fetch_macro_data(client)
-            
-            # Map macro dict to output fields
-            country_map = {
-                "US": output.macro_us,
-                "UK": output.macro_uk,
-                "EU": output.macro_eu,
-                "JP": output.macro_jp,
-                "CN": output.macro_cn,
-                "DE": output.macro_de,
-                "FR": output.macro_fr,
-                "IT": output.macro_it,
-                "ES": output.macro_es,
-                "CA": output.macro_ca,
-                "AU": output.macro_au,
-                "BR": output.macro_br,
-                "IN": output.macro_in,
-            }
-            
+            # Step 2: Assign each country's indicators to its macro_<cc> field
             for country, indicators in macro.items():
-                if country in country_map:
-                    country_map[country] = indicators
+                attr = f"macro_{country.lower()}"
+                if hasattr(output, attr):
+                    setattr(output, attr, indicators)
             
-            # Step 3: Fetch news headlines
-            logger.info("\n[3/4] Fetching news headlines...")
-            news = await fetch_headlines(client)
+            # Step 3: News headlines
             output.market_headlines = news.get("market_headlines", [])
             output.earnings_announcements = news.get("earnings_announcements", [])
             output.dividend_news = news.get("dividend_news", [])
@@ -277,7 +337,7 @@ async def run_pipeline(
                 "scraped_at": datetime.utcnow().isoformat(),
                 "pipeline_version": "1.0.0",
                 "data_sources": list(DEFAULT_URLS.keys()),
-                "retry_config": RETRY_CONFIG,
+                "retry_config": dict(RETRY_CONFIG),
                 "rate_limit_delay": RATE_LIMIT_DELAY,
                 "http_timeout": HTTP_TIMEOUT,
                 "selectors_used": list(SELECTORS.keys()),
@@ -290,41 +350,44 @@ async def run_pipeline(
         errors.append("Pipeline interrupted by user")
         output.errors = errors
     except Exception as e:
-        logger.error(f"\nPipeline failed: {e}")
-        logger.debug(traceback.format_exc())
+        logger.error("\nPipeline failed: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
         errors.append(str(e))
         output.errors = errors
+    finally:
+        pool.shutdown(cancel_futures=True)
+        set_scrape_timestamp(None)
+    
+    # Parsers build records without validation; optionally check them once here
+    if strict:
+        try:
+            output = TradingEconomicsOutput.model_validate(output.model_dump())
+        except ValidationError as e:
+            logger.error("Strict validation failed: %s", e)
+            output.errors.append(f"validation: {e.error_count()} invalid fields")
     
-    # Calculate duration
+    # Calculate duration; counts are computed once and reused below
     duration = (datetime.utcnow() - start_time).total_seconds()
+    summary = output.summary()
     logger.info("\n" + "=" * 50)
     logger.info("Pipeline Complete")
-    logger.info(f"Duration: {duration:.2f} seconds")
-    logger.info(f"Total items: {output.total_items()}")
-    logger.info(f"Errors: {len(output.errors)}")
+    logger.info("Duration: %.2f seconds", duration)
+    logger.info("Total items: %d", summary['total_items'])
+    logger.info("Errors: %d", summary['errors'])
     logger.info("=" * 50)
     
     # Summary
-    summary = output.summary()
     logger.info("\nData Summary:")
-    logger.info(f"  Markets: {sum(summary['markets'].values())} instruments")
-    logger.info(f"  Macro: {sum(summary['macroeconomics'].values())} indicators")
-    logger.info(f"  News: {sum(summary['news'].values())} articles")
+    logger.info("  Markets: %d instruments", sum(summary['markets'].values()))
+    logger.info("  Macro: %d indicators", sum(summary['macroeconomics'].values()))
+    logger.info("  News: %d articles", sum(summary['news'].values()))
     
-    # Output JSON if path specified
+    # Output JSON if path specified (orjson handles datetime and Enum natively)
     if output_path:
-        output_json = output.model_dump(mode='json')
-        
-        # Make datetime serializable
-        def default_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_json, f, indent=2, default=default_serializer, ensure_ascii=False)
+        write_output_json(output, output_path)
         
-        logger.info(f"\nOutput saved to: {output_path}")
+        logger.info("\nOutput saved to: %s", output_path)
     
     return output
 
@@ -356,6 +419,12 @@ Examples:
         help="Enable verbose/debug logging",
     )
     
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Validate all parsed records before writing output",
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -365,14 +434,26 @@ Examples:
     return parser.parse_args()
 
 
+def _use_uvloop() -> None:
+    """Switch asyncio to uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        # Not available on Windows; the default loop works fine
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Main entry point."""
     args = parse_args()
+    _use_uvloop()
     
     try:
         output = asyncio.run(run_pipeline(
             output_path=args.output,
             verbose=args.verbose,
+            strict=args.strict,
         ))
         
         # Print summary to stdout if no output file
@@ -382,8 +463,8 @@ def main():
             print("Scraping Complete - Summary")
             print("=" * 50)
             print(json.dumps(summary, indent=2))
-            print(f"\nTotal items scraped: {output.total_items()}")
-            print(f"Errors: {len(output.errors)}")
+            print(f"\nTotal items scraped: {summary['total_items']}")
+            print(f"Errors: {summary['errors']}")
         
         # Exit with error code if there were critical errors
         if output.errors and len(output.errors) >= 3:
@@ -392,11 +473,12 @@ def main():
         sys.exit(0)
         
     except ScraperError as e:
-        logger.error(f"Scraper error: {e}")
+        logger.error("Scraper error: %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        logger.debug(traceback.format_exc())
+        logger.error("Unexpected error: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
         sys.exit(1)
 
 
@@ -1,18 +1,32 @@
 # Trading Economics Scraper Configuration
 
+import itertools
+from types import MappingProxyType
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
 # HTTP Timeout Configuration (seconds)
 HTTP_TIMEOUT = 30.0
 
+# Connection Pool (one HTTP/2 pool shared by every fetch in a run)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_MAX_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
 # Retry Configuration
-RETRY_CONFIG = {
+RETRY_CONFIG = MappingProxyType({
     "max_retries": 3,
     "backoff_factor": 0.5,
-    "status_forcelist": [429, 500, 502, 503, 504],
-}
+    "status_forcelist": (429, 500, 502, 503, 504),
+})
 
 # Rate Limiting (seconds between requests)
 RATE_LIMIT_DELAY = 5.0
 
+# Maximum concurrent outbound requests per pipeline phase
+MAX_CONCURRENT_REQUESTS = 6
+
 # User-Agent Rotation List
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -22,17 +36,35 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
+# Only advertise Brotli when httpx can decode it (brotli or brotlicffi installed)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
 # Base Headers (User-Agent will be rotated)
-HEADERS = {
+HEADERS = MappingProxyType({
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
-    "Accept-Encoding": "gzip, deflate",
+    "Accept-Encoding": ACCEPT_ENCODING,
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
-}
+})
+
+# Full request headers, one per User-Agent, merged once at import and
+# handed out round-robin (read-only: copy before adding headers)
+PRECOMPUTED_HEADERS = tuple(
+    MappingProxyType({**HEADERS, "User-Agent": ua}) for ua in USER_AGENTS
+)
+HEADER_CYCLE = itertools.cycle(PRECOMPUTED_HEADERS)
 
 # Page Element Selectors
-SELECTORS = {
+SELECTORS = MappingProxyType({
     # Core selector for all market panels
     "product_list": ".product-item, .product-card, .ec-product",
     "product_name": ".product-title, .name, h3, h2",
@@ -110,4 +142,13 @@ SELECTORS = {
     "table_header": "thead th, tr:first-child th",
     "table_row": "tbody tr, tr.row-data",
     "table_cell": "td, th",
-}
+})
+
+# Selectors compiled once at import (SELECTORS is read-only)
+COMPILED_SELECTORS = MappingProxyType({
+    key: CSSSelector(selector, translator="html") for key, selector in SELECTORS.items()
+})
+
+# One HTML parser shared by every page parse (lxml locks its context per parse).
+# Comments are kept: dropping them would merge the text around them into one node.
+HTML_PARSER = lxml.html.HTMLParser(remove_blank_text=True, collect_ids=False)
@@ -5,10 +5,10 @@ Models for validated data structures.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from itertools import chain
+from typing import Annotated, ClassVar, List, Literal, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, model_validator
-import re
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator
 
 
 class MarketCategory(str, Enum):
@@ -40,22 +40,62 @@ class CountryCode(str, Enum):
     IN = "IN"
 
 
-# SIMPLIFIED URL PATTERN (Python 3.10-3.14 compatible)
-URL_PATTERN = re.compile(
-    r'^https?://[\w.-]+(?:\.[\w-]+)+(?:/\S*)?$',
-    re.IGNORECASE
-)
+# Field patterns, matched by pydantic-core's Rust regex engine
+URL_PATTERN = r'(?i)^https?://[\w.-]+(?:\.[\w-]+)+(?:/\S*)?$'
+SYMBOL_PATTERN = r'^[A-Za-z0-9\-\.\/]+$'
 
 
-class MarketInstrument(BaseModel):
+def _lower_if_str(value):
+    """Case-fold string input ahead of Literal validation."""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Allowed values, checked by pydantic-core as Literals (input is case-folded first)
+Frequency = Annotated[
+    Literal['daily', 'weekly', 'monthly', 'quarterly', 'yearly'],
+    BeforeValidator(_lower_if_str),
+]
+Sentiment = Annotated[
+    Literal['positive', 'negative', 'neutral', 'bullish', 'bearish'],
+    BeforeValidator(_lower_if_str),
+]
+
+# One timestamp shared by every record built during the current scrape run
+_CURRENT_SCRAPE_TS: Optional[datetime] = None
+
+
+def set_scrape_timestamp(ts: Optional[datetime]) -> None:
+    """Stamp records built from now on with ts (None: per-record utcnow)."""
+    global _CURRENT_SCRAPE_TS
+    _CURRENT_SCRAPE_TS = ts
+
+
+def scrape_timestamp() -> datetime:
+    """Current batch timestamp, falling back to utcnow outside a run."""
+    return _CURRENT_SCRAPE_TS or datetime.utcnow()
+
+
+class ParsedRecord(BaseModel):
+    """Base for records emitted by the HTML parsers."""
+
+    # Records are immutable once built; unknown keys are dropped, not rejected
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @classmethod
+    def build_trusted(cls, **fields):
+        """Build from parser output without running validators."""
+        return cls.model_construct(**fields)
+
+
+class MarketInstrument(ParsedRecord):
     """Model for a single market instrument/asset."""
-    symbol: str = Field(..., min_length=1, max_length=50)
+    symbol: str = Field(..., min_length=1, max_length=50, pattern=SYMBOL_PATTERN)
     name: str = Field(..., min_length=1, max_length=200)
     value: float = Field(...)
     change: Optional[float] = None
     pct_change: Optional[float] = Field(None, ge=-100, le=100)
     category: MarketCategory = Field(...)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=scrape_timestamp)
     bid: Optional[float] = None
     ask: Optional[float] = None
     high: Optional[float] = None
@@ -63,63 +103,42 @@ class MarketInstrument(BaseModel):
     open: Optional[float] = None
     previous_close: Optional[float] = None
 
+    @classmethod
+    def build_trusted(cls, **fields) -> "MarketInstrument":
+        """Build from parser output; applies the symbol upper-casing only."""
+        fields["symbol"] = fields["symbol"].upper()
+        return cls.model_construct(**fields)
+
     @field_validator('symbol')
     @classmethod
-    def symbol_must_be_valid(cls, v: str) -> str:
-        if not re.match(r'^[A-Za-z0-9\-\.\/]+$', v):
-            raise ValueError(f"Invalid symbol format: {v}")
+    def symbol_to_upper(cls, v: str) -> str:
         return v.upper()
 
 
-class MacroIndicator(BaseModel):
+class MacroIndicator(ParsedRecord):
     """Model for macroeconomic indicators."""
     country: CountryCode = Field(...)
     indicator_name: str = Field(..., min_length=1, max_length=100)
     value: Optional[float] = None
     previous: Optional[float] = None
     unit: str = Field(default="%", max_length=20)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    frequency: str = Field(default="monthly", max_length=20)
+    timestamp: datetime = Field(default_factory=scrape_timestamp)
+    frequency: Frequency = "monthly"
     source: Optional[str] = Field(None, max_length=100)
     actual: Optional[str] = Field(None, max_length=20)
     forecast: Optional[float] = None
     period: Optional[str] = Field(None, max_length=50)
 
-    @field_validator('frequency')
-    @classmethod
-    def frequency_must_be_valid(cls, v: str) -> str:
-        valid = ['daily', 'weekly', 'monthly', 'quarterly', 'yearly']
-        if v.lower() not in valid:
-            raise ValueError(f"Invalid frequency: {v}")
-        return v.lower()
-
 
-class NewsArticle(BaseModel):
+class NewsArticle(ParsedRecord):
     """Model for news articles."""
     title: str = Field(..., min_length=1, max_length=500)
     summary: Optional[str] = Field(None, max_length=2000)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    url: str = Field(..., max_length=1000)
+    timestamp: datetime = Field(default_factory=scrape_timestamp)
+    url: str = Field(..., max_length=1000, pattern=URL_PATTERN)
     source: Optional[str] = Field(None, max_length=100)
     category: Optional[str] = Field(None, max_length=50)
-    sentiment: Optional[str] = Field(None, max_length=20)
-
-    @field_validator('url')
-    @classmethod
-    def url_must_be_valid(cls, v: str) -> str:
-        if not URL_PATTERN.match(v):
-            raise ValueError(f"Invalid URL format: {v}")
-        return v
-
-    @field_validator('sentiment')
-    @classmethod
-    def sentiment_must_be_valid(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        valid = ['positive', 'negative', 'neutral', 'bullish', 'bearish']
-        if v.lower() not in valid:
-            raise ValueError(f"Invalid sentiment: {v}")
-        return v.lower()
+    sentiment: Optional[Sentiment] = None
 
 
 class TradingEconomicsOutput(BaseModel):
@@ -151,19 +170,44 @@ class TradingEconomicsOutput(BaseModel):
     metadata: dict = Field(default_factory=dict)
     errors: List[str] = Field(default_factory=list)
 
+    _MARKET_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'forex', 'indices', 'commodities', 'bonds',
+        'crypto', 'stocks', 'etfs', 'derivatives',
+    )
+    _MACRO_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'macro_us', 'macro_uk', 'macro_eu', 'macro_jp', 'macro_cn',
+        'macro_de', 'macro_fr', 'macro_it', 'macro_es', 'macro_ca',
+        'macro_au', 'macro_br', 'macro_in',
+    )
+    _NEWS_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'market_headlines', 'earnings_announcements', 'dividend_news',
+    )
+
     def total_items(self) -> int:
-        return len(self.forex) + len(self.indices) + len(self.commodities) + \
-               len(self.bonds) + len(self.crypto) + len(self.stocks) + \
-               len(self.etfs) + len(self.derivatives) + \
-               len(self.all_macro_indicators()) + len(self.all_news())
+        return sum(
+            len(getattr(self, attr))
+            for attr in self._MARKET_FIELDS + self._MACRO_FIELDS + self._NEWS_FIELDS
+        )
 
     def all_macro_indicators(self) -> List[MacroIndicator]:
-        return [ind for attr in dir(self) 
-                if attr.startswith('macro_') 
-                for ind in getattr(self, attr)]
+        return list(chain.from_iterable(getattr(self, attr) for attr in self._MACRO_FIELDS))
 
     def all_news(self) -> List[NewsArticle]:
-        return self.market_headlines + self.earnings_announcements + self.dividend_news
+        return list(chain.from_iterable(getattr(self, attr) for attr in self._NEWS_FIELDS))
+
+    def to_json(self, indent: Optional[int] = None) -> bytes:
+        """Serialize to JSON bytes in pydantic-core (no intermediate dict)."""
+        return self.__pydantic_serializer__.to_json(self, indent=indent)
 
     def summary(self) -> dict:
-        return {"total_items": self.total_items(), "errors": len(self.errors)}
+        """Per-field counts by section, plus totals (one pass over the lists)."""
+        markets = {attr: len(getattr(self, attr)) for attr in self._MARKET_FIELDS}
+        macro = {attr: len(getattr(self, attr)) for attr in self._MACRO_FIELDS}
+        news = {attr: len(getattr(self, attr)) for attr in self._NEWS_FIELDS}
+        return {
+            "markets": markets,
+            "macroeconomics": macro,
+            "news": news,
+            "total_items": sum(markets.values()) + sum(macro.values()) + sum(news.values()),
+            "errors": len(self.errors),
+        }
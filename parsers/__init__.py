@@ -1,7 +1,7 @@
 """
 Parsers Package
 
-Market data parsers using BeautifulSoup4 with lxml.
+Market data parsers using lxml.
 """
 
 from parsers.markets import (
@@ -18,8 +18,14 @@ from parsers.markets import (
 
 from parsers.macro import (
     parse_macro_indicators,
+    parse_macro_indicators_from_tree,
+    parse_macro_indicators_stream,
+    clear_macro_cache,
+    cached_macro_indicators,
+    cache_macro_indicators,
     parse_country_macro,
     parse_all_countries_separate,
+    parse_headline_indicators,
     parse_gdp_only,
     parse_inflation_only,
     parse_unemployment_only,
@@ -54,8 +60,14 @@ __all__ = [
     "parse_major_indexes",
     # Macro
     "parse_macro_indicators",
+    "parse_macro_indicators_from_tree",
+    "parse_macro_indicators_stream",
+    "clear_macro_cache",
+    "cached_macro_indicators",
+    "cache_macro_indicators",
     "parse_country_macro",
     "parse_all_countries_separate",
+    "parse_headline_indicators",
     "parse_gdp_only",
     "parse_inflation_only",
     "parse_unemployment_only",
@@ -0,0 +1,33 @@
+"""
+Shared lxml helpers
+
+Document parsing and BS4-compatible text extraction used by every parser.
+"""
+
+from typing import Optional, Union
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+
+from config import HTML_PARSER
+
+# Text nodes as BS4 get_text() sees them (script/style/template content excluded)
+TEXT_NODES = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template)]',
+    smart_strings=False,
+)
+
+
+def parse_document(html: Union[str, bytes]) -> Optional[HtmlElement]:
+    """Parse HTML into an lxml tree (None for empty/unparseable input)."""
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html, parser=HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def cell_text(element: HtmlElement) -> str:
+    """Concatenate stripped text nodes (same result as BS4 get_text(strip=True))."""
+    return "".join(text.strip() for text in TEXT_NODES(element))
@@ -1,14 +1,53 @@
 """
 Derivatives Parser
 
-Parses futures and options market data from HTML.
+Parses futures and options market data from HTML using lxml.
 """
 
+import re
 from typing import List, Optional
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from pydantic import TypeAdapter, ValidationError
 
-from models import MarketInstrument, MarketCategory
+from models import MarketInstrument, MarketCategory, scrape_timestamp
+from parsers._lxml import cell_text, parse_document
+
+
+# Trailing 2-digit contract month code (e.g. ESM25 -> ESM)
+_MONTH_CODE_RE = re.compile(r'[0-9]{2}$')
+
+# Root symbols whose month-coded variants are collapsed back to the root
+_MONTH_CLEANABLE = frozenset({'ES', 'NQ', 'YM', 'RTY', 'CL', 'NG', 'GC', 'SI', 'HG'})
+
+# Symbols that identify a derivatives row when no dedicated panel exists
+_DERIV_SYMBOLS = frozenset({
+    'VIX', 'VXST', 'VXN', 'VXO',  # Volatility indexes
+    'ES', 'NQ', 'YM', 'RTY',  # E-mini futures
+    'CL', 'NG', 'GC', 'SI', 'HG', 'ZC', 'ZS', 'ZM', 'ZL',  # Commodity futures
+    'ZB', 'ZC', 'ZN', 'ZF', 'ZT',  # Treasury futures
+    'ED', 'EU', 'BP', 'CD', 'JY', 'SF', 'AD', 'NZD',  # Currency futures
+    'ESM25', 'NQM25', 'YMH25', 'CLM25', 'NGM25', 'GCM25',  # Month-coded futures
+    'SPX', 'SPY', 'QQQ', 'IWM',  # Index products
+})
+
+# Row selectors, compiled once
+_PANEL_ROWS = CSSSelector('tbody tr.row-data, tbody tr', translator='html')
+_DERIV_TABLE_ROWS = CSSSelector(
+    '.futures-table tbody tr, #futures tbody tr, .derivatives-table tbody tr', translator='html'
+)
+_ALL_TABLE_ROWS = CSSSelector('table tbody tr', translator='html')
+
+# Validates a whole page of parsed rows in one pydantic-core call
+_INSTRUMENT_LIST_ADAPTER = TypeAdapter(List[MarketInstrument])
+
+# Class substrings that mark a derivatives table
+_DERIV_TABLE_CLASS_RE = re.compile(r'future|derivative|option|vix|index-future', re.IGNORECASE)
+
+# Single-pass cleanup tables for the numeric cell parsers (unicode minus/en dash -> '-')
+_PRICE_TRANS = str.maketrans({'$': '', '¥': '', '€': '', '£': '', ',': '', '−': '-', '–': '-'})
+_CHANGE_TRANS = str.maketrans({'+': '', '−': '-', '–': '-'})
+_PCT_TRANS = str.maketrans({'%': '', '+': '', '−': '-', '–': '-'})
 
 
 def _parse_price(value: str) -> Optional[float]:
@@ -16,13 +55,8 @@ def _parse_price(value: str) -> Optional[float]:
     if not value or not value.strip():
         return None
     try:
-        cleaned = value.strip()
-        # Remove common prefixes/suffixes
-        for char in ['$', '¥', '€', '£', ',']:
-            cleaned = cleaned.replace(char, '')
-        # Handle negative signs
-        cleaned = cleaned.replace('−', '-').replace('–', '-')
-        return float(cleaned)
+        # Remove currency symbols/commas and normalize negative signs
+        return float(value.strip().translate(_PRICE_TRANS))
     except (ValueError, TypeError):
         return None
 
@@ -32,8 +66,7 @@ def _parse_change(value: str) -> Optional[float]:
     if not value or not value.strip():
         return None
     try:
-        cleaned = value.strip().replace('+', '').replace('−', '-').replace('–', '-')
-        return float(cleaned)
+        return float(value.strip().translate(_CHANGE_TRANS))
     except (ValueError, TypeError):
         return None
 
@@ -43,55 +76,63 @@ def _parse_percentage(value: str) -> Optional[float]:
     if not value or not value.strip():
         return None
     try:
-        cleaned = value.strip().replace('%', '').replace('−', '-').replace('–', '-').replace('+', '')
-        return float(cleaned)
+        return float(value.strip().translate(_PCT_TRANS))
     except (ValueError, TypeError):
         return None
 
 
-def _find_derivatives_rows(soup: BeautifulSoup) -> List[Tag]:
+def _row_cells(row: HtmlElement) -> List[HtmlElement]:
+    """The row's own td/th cells (direct children only, no descent)."""
+    return list(row.iterchildren('td', 'th'))
+
+
+def _validate_rows(rows: List[dict]) -> List[MarketInstrument]:
+    """Validate row dicts in one batch, dropping any row that fails validation."""
+    try:
+        return _INSTRUMENT_LIST_ADAPTER.validate_python(rows)
+    except ValidationError as e:
+        invalid = {error['loc'][0] for error in e.errors()}
+        return _INSTRUMENT_LIST_ADAPTER.validate_python(
+            [row for i, row in enumerate(rows) if i not in invalid]
+        )
+
+
+def _find_derivatives_rows(tree: HtmlElement) -> List[HtmlElement]:
     """Find all derivatives rows in the HTML."""
     # Try panel ID first
-    panel = soup.find(id='futures') or soup.find(id='derivatives') or soup.find(id='options')
-    if panel:
-        return panel.select('tbody tr.row-data, tbody tr')
+    for panel_id in ('futures', 'derivatives', 'options'):
+        panel = tree.get_element_by_id(panel_id, None)
+        if panel is not None:
+            return _PANEL_ROWS(panel)
     
     # Try table with derivatives-related class
-    tables = soup.find_all('table', class_=lambda c: c and any(
-        x in str(c).lower() for x in ['future', 'derivative', 'option', 'vix', 'index-future']
-    ))
+    tables = [
+        table for table in tree.iter('table')
+        if _DERIV_TABLE_CLASS_RE.search(table.get('class', ''))
+    ]
     if tables:
         rows = []
         for table in tables:
-            rows.extend(table.select('tbody tr.row-data, tbody tr'))
+            rows.extend(_PANEL_ROWS(table))
         return rows
     
     # Try finding by selector pattern
-    rows = soup.select('.futures-table tbody tr, #futures tbody tr, .derivatives-table tbody tr')
+    rows = _DERIV_TABLE_ROWS(tree)
     if rows:
         return rows
     
     # Fallback: look for common derivatives symbols in first column
-    all_rows = soup.select('table tbody tr')
+    all_rows = _ALL_TABLE_ROWS(tree)
     deriv_rows = []
-    deriv_symbols = {
-        'VIX', 'VXST', 'VXN', 'VXO',  # Volatility indexes
-        'ES', 'NQ', 'YM', 'RTY',  # E-mini futures
-        'CL', 'NG', 'GC', 'SI', 'HG', 'ZC', 'ZS', 'ZM', 'ZL',  # Commodity futures
-        'ZB', 'ZC', 'ZN', 'ZF', 'ZT',  # Treasury futures
-        'ED', 'EU', 'BP', 'CD', 'JY', 'SF', 'AD', 'NZD',  # Currency futures
-        'ESM25', 'NQM25', 'YMH25', 'CLM25', 'NGM25', 'GCM25',  # Month-coded futures
-        'SPX', 'SPY', 'QQQ', 'IWM',  # Index products
-    }
     
     for row in all_rows:
-        cells = row.find_all(['td', 'th'])
+        cells = _row_cells(row)
         if cells:
-            symbol_text = cells[0].get_text(strip=True).upper()
+            symbol_text = cell_text(cells[0]).upper()
             # Check if symbol matches derivatives pattern
-            if any(sym in symbol_text for sym in deriv_symbols):
+            if any(sym in symbol_text for sym in _DERIV_SYMBOLS):
                 deriv_rows.append(row)
-            elif symbol_text in deriv_symbols:
+            elif symbol_text in _DERIV_SYMBOLS:
                 deriv_rows.append(row)
     
     return deriv_rows
@@ -107,31 +148,37 @@ def parse_derivatives(html: str) -> List[MarketInstrument]:
     Returns:
         List of MarketInstrument objects with MarketCategory.DERIVATIVES
     """
-    instruments = []
-    soup = BeautifulSoup(html, "lxml")
+    rows_data = []
+    tree = parse_document(html)
+    if tree is None:
+        return []
+    # One timestamp for every row of this page
+    timestamp = scrape_timestamp()
     
-    rows = _find_derivatives_rows(soup)
+    rows = _find_derivatives_rows(tree)
     
     for row in rows:
         try:
-            cells = row.find_all(['td', 'th'])
+            cells = _row_cells(row)
             if len(cells) < 2:
                 continue
+            # Text of each cell, extracted once per row
+            texts = [cell_text(cell) for cell in cells]
             
             # Extract symbol from first cell
-            symbol_cell = cells[0].get_text(strip=True)
-            link = cells[0].find('a')
-            if link:
-                symbol = link.get_text(strip=True)
+            symbol_cell = texts[0]
+            # Only cells with child elements can hold a link
+            link = cells[0].find('.//a') if len(cells[0]) else None
+            if link is not None:
+                symbol = cell_text(link)
             else:
                 symbol = symbol_cell
             
             # Clean symbol (remove month codes sometimes appended)
             if symbol and len(symbol) > 8:
                 # Try to get clean symbol
-                import re
-                clean = re.sub(r'[0-9]{2}$', '', symbol)  # Remove trailing 2 digits (month code)
-                if clean in ['ES', 'NQ', 'YM', 'RTY', 'CL', 'NG', 'GC', 'SI', 'HG']:
+                clean = _MONTH_CODE_RE.sub('', symbol)  # Remove trailing 2 digits (month code)
+                if clean in _MONTH_CLEANABLE:
                     symbol = clean
             
             if not symbol or len(symbol) > 12:
@@ -140,14 +187,13 @@ def parse_derivatives(html: str) -> List[MarketInstrument]:
             # Extract name
             name = symbol_cell
             if len(cells) > 1:
-                name = cells[1].get_text(strip=True)
+                name = texts[1]
                 if not name or name == symbol:
                     name = f"{symbol} Futures"
             
             # Parse price (usually column 2 or 3)
             price = None
-            for cell in cells[2:4]:
-                text = cell.get_text(strip=True)
+            for text in texts[2:4]:
                 price = _parse_price(text)
                 if price is not None:
                     break
@@ -156,35 +202,33 @@ def parse_derivatives(html: str) -> List[MarketInstrument]:
             change = None
             pct_change = None
             
-            for i, cell in enumerate(cells[3:], start=3):
-                text = cell.get_text(strip=True)
-                
+            for text in texts[3:]:
                 # Try to identify percentage change
                 if '%' in text:
                     pct = _parse_percentage(text)
                     if pct is not None:
                         pct_change = pct
                 # Try regular change value
-                elif text and not any(c in text for c in ['$', '%']):
+                elif text and '$' not in text:  # '%' already ruled out above
                     chg = _parse_change(text)
                     if chg is not None and abs(chg) < 1000:
                         change = chg
             
             if price is not None:
-                instrument = MarketInstrument(
-                    symbol=symbol.upper(),
-                    name=name,
-                    value=price,
-                    change=change,
-                    pct_change=pct_change,
-                    category=MarketCategory.DERIVATIVES,
-                )
-                instruments.append(instrument)
+                rows_data.append({
+                    'symbol': symbol.upper(),
+                    'name': name,
+                    'value': price,
+                    'change': change,
+                    'pct_change': pct_change,
+                    'category': MarketCategory.DERIVATIVES,
+                    'timestamp': timestamp,
+                })
                 
         except (ValueError, TypeError, AttributeError, IndexError):
             continue
     
-    return instruments
+    return _validate_rows(rows_data)
 
 
 def parse_derivatives_with_fallback(
@@ -203,11 +247,16 @@ def parse_derivatives_with_fallback(
     """
     instruments = parse_derivatives(html)
     
-    if not instruments and fallback_derivatives:
+    if not instruments and fallback_derivatives is DEFAULT_DERIVATIVES:
+        # Shared prebuilt records carry the import time; stamp them for this run
+        stamp = {'timestamp': scrape_timestamp()}
+        instruments.extend(i.model_copy(update=stamp) for i in _DEFAULT_DERIVATIVE_INSTRUMENTS)
+    elif not instruments and fallback_derivatives:
+        # Fallback rows are shipped with the code; skip re-validating them
         for deriv_data in fallback_derivatives:
             try:
-                instrument = MarketInstrument(
-                    symbol=deriv_data.get('symbol', '').upper(),
+                instrument = MarketInstrument.build_trusted(
+                    symbol=deriv_data.get('symbol', ''),
                     name=deriv_data.get('name', f"{deriv_data.get('symbol', '')} Futures"),
                     value=deriv_data.get('value', 0.0),
                     change=deriv_data.get('change'),
@@ -215,7 +264,7 @@ def parse_derivatives_with_fallback(
                     category=MarketCategory.DERIVATIVES,
                 )
                 instruments.append(instrument)
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, AttributeError):
                 continue
     
     return instruments
@@ -237,6 +286,19 @@ DEFAULT_DERIVATIVES = [
     {"symbol": "VXST", "name": "CBOE Short-Term Volatility Index", "value": 12.80, "change": 0.35, "pct_change": 2.81},
 ]
 
+# Built once at import; re-stamped per fallback call
+_DEFAULT_DERIVATIVE_INSTRUMENTS = tuple(
+    MarketInstrument.build_trusted(
+        symbol=d['symbol'],
+        name=d['name'],
+        value=d['value'],
+        change=d['change'],
+        pct_change=d['pct_change'],
+        category=MarketCategory.DERIVATIVES,
+    )
+    for d in DEFAULT_DERIVATIVES
+)
+
 
 if __name__ == "__main__":
     # Test the parser
@@ -1,68 +1,98 @@
 """
 ETFs Parser
 
-Parses ETF (Exchange-Traded Fund) market data from HTML.
+Parses ETF (Exchange-Traded Fund) market data from HTML using lxml.
 """
 
 from typing import List, Optional
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 
-from models import MarketInstrument, MarketCategory
+from models import MarketInstrument, MarketCategory, scrape_timestamp
+from parsers._lxml import cell_text, parse_document
+
+# fastnumbers converts without raising on bad input; plain float() otherwise
+try:
+    from fastnumbers import try_float
+except ImportError:
+    def _to_float(value: str) -> Optional[float]:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+else:
+    def _to_float(value: str) -> Optional[float]:
+        return try_float(value, on_fail=None, allow_underscores=True)
+
+
+# Model's core validator, called directly to skip BaseModel.__init__ per row
+_validate_instrument = MarketInstrument.__pydantic_validator__.validate_python
+
+# Row selectors, compiled once at import
+_PANEL_ROWS = CSSSelector('tbody tr.row-data, tbody tr')
+_ETF_TABLE_ROWS = CSSSelector('.etf-table tbody tr, #etfs tbody tr')
+_ALL_TABLE_ROWS = CSSSelector('table tbody tr')
+_ETF_TABLES = CSSSelector('table[class*="etf" i]')
+
+# Symbols that identify an ETF row when no dedicated panel exists
+_ETF_SYMBOLS = frozenset({
+    'SPY', 'QQQ', 'IWM', 'VTI', 'VOO', 'IVV', 'DIA', 'EEM', 'EFA', 'VWO',
+    'AGG', 'BND', 'TLT', 'SHY', 'IEI', 'LQD', 'VCIT', 'VCSH', 'HYG', 'JNK',
+    'GLD', 'SLV', 'USO', 'UNG', 'DBA', 'DBC', 'GSG', 'CRB', 'PDBC',
+})
+
+# Single-pass cleanup tables for the numeric cell parsers
+_PRICE_TRANS = str.maketrans({'$': '', ',': '', ' ': ''})
+_PCT_TRANS = str.maketrans({'%': '', '−': '-', '–': '-'})
 
 
 def _parse_price(value: str) -> Optional[float]:
     """Parse a price string to float."""
     if not value or not value.strip():
         return None
-    try:
-        cleaned = value.strip().replace('$', '').replace(',', '').replace(' ', '')
-        return float(cleaned)
-    except (ValueError, TypeError):
-        return None
+    return _to_float(value.strip().translate(_PRICE_TRANS))
 
 
 def _parse_percentage(value: str) -> Optional[float]:
     """Parse a percentage string to float."""
     if not value or not value.strip():
         return None
-    try:
-        cleaned = value.strip().replace('%', '').replace('−', '-').replace('–', '-')
-        return float(cleaned)
-    except (ValueError, TypeError):
-        return None
+    return _to_float(value.strip().translate(_PCT_TRANS))
 
 
-def _find_etf_rows(soup: BeautifulSoup) -> List[Tag]:
+def _row_cells(row: HtmlElement) -> List[HtmlElement]:
+    """The row's own td/th cells (direct children only)."""
+    return list(row.iterchildren('td', 'th'))
+
+
+def _find_etf_rows(tree: HtmlElement) -> List[HtmlElement]:
     """Find all ETF rows in the HTML."""
     # Try panel ID first
-    panel = soup.find(id='etf') or soup.find(id='etfs') or soup.find(id='exchange-traded-funds')
-    if panel:
-        return panel.select('tbody tr.row-data, tbody tr')
+    for panel_id in ('etf', 'etfs', 'exchange-traded-funds'):
+        panel = tree.get_element_by_id(panel_id, None)
+        if panel is not None:
+            return _PANEL_ROWS(panel)
     
     # Try table with ETF-related class
-    tables = soup.find_all('table', class_=lambda c: c and 'etf' in str(c).lower())
+    tables = _ETF_TABLES(tree)
     if tables:
         rows = []
         for table in tables:
-            rows.extend(table.select('tbody tr.row-data, tbody tr'))
+            rows.extend(_PANEL_ROWS(table))
         return rows
     
     # Try finding by selector pattern
-    rows = soup.select('.etf-table tbody tr, #etfs tbody tr')
+    rows = _ETF_TABLE_ROWS(tree)
     if rows:
         return rows
     
     # Fallback: look for common ETF symbols in first column
-    all_rows = soup.select('table tbody tr')
+    all_rows = _ALL_TABLE_ROWS(tree)
     etf_rows = []
-    etf_symbols = {'SPY', 'QQQ', 'IWM', 'VTI', 'VOO', 'IVV', 'DIA', 'EEM', 'EFA', 'VWO', 
-                   'AGG', 'BND', 'TLT', 'SHY', 'IEI', 'LQD', 'VCIT', 'VCSH', 'HYG', 'JNK',
-                   'GLD', 'SLV', 'USO', 'UNG', 'DBA', 'DBC', 'GSG', 'CRB', 'PDBC', 'GSG'}
     
     for row in all_rows:
-        cells = row.find_all(['td', 'th'])
-        if cells and cells[0].get_text(strip=True).upper() in etf_symbols:
+        cells = _row_cells(row)
+        if cells and cell_text(cells[0]).upper() in _ETF_SYMBOLS:
             etf_rows.append(row)
     
     return etf_rows
@@ -79,22 +109,25 @@ def parse_etfs(html: str) -> List[MarketInstrument]:
         List of MarketInstrument objects with MarketCategory.ETFS
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
+    if tree is None:
+        return instruments
     
-    rows = _find_etf_rows(soup)
+    rows = _find_etf_rows(tree)
     
     for row in rows:
         try:
-            cells = row.find_all(['td', 'th'])
+            cells = _row_cells(row)
             if len(cells) < 2:
                 continue
+            texts = [cell_text(cell) for cell in cells]
             
             # Extract symbol from first cell
-            symbol_cell = cells[0].get_text(strip=True)
-            # Try to get from link if present
-            link = cells[0].find('a')
-            if link:
-                symbol = link.get_text(strip=True)
+            symbol_cell = texts[0]
+            # Try to get from link if present (needs a child element)
+            link = cells[0].find('.//a') if len(cells[0]) else None
+            if link is not None:
+                symbol = cell_text(link)
             else:
                 symbol = symbol_cell
             
@@ -104,44 +137,44 @@ def parse_etfs(html: str) -> List[MarketInstrument]:
             # Extract name
             name = symbol_cell
             if len(cells) > 1:
-                name = cells[1].get_text(strip=True)
+                name = texts[1]
                 if not name or name == symbol:
                     name = f"{symbol} ETF"
             
             # Parse price (usually column 2 or 3)
             price = None
-            for cell in cells[2:4]:
-                price = _parse_price(cell.get_text(strip=True))
+            for text in texts[2:4]:
+                price = _parse_price(text)
                 if price is not None:
                     break
             
-            # Parse change and pct_change
-            change = None
+            # Parse change and pct_change from column 3 on
+            last_cols = max(3, len(texts) - 2)
+            
+            # pct_change sits in one of the last two columns (the last one wins)
             pct_change = None
+            for text in reversed(texts[last_cols:]):
+                pct_change = _parse_percentage(text)
+                if pct_change is not None:
+                    break
             
-            # Try to find percentage change in later columns
-            for i, cell in enumerate(cells[3:], start=3):
-                text = cell.get_text(strip=True)
+            # Earlier columns may hold the change (last small value wins)
+            change = None
+            for text in reversed(texts[3:last_cols]):
                 pct = _parse_percentage(text)
-                if pct is not None:
-                    # Typically the last numeric column with % is pct_change
-                    if i == len(cells) - 1:
-                        pct_change = pct
-                    elif i == len(cells) - 2:
-                        pct_change = pct
-                    # Check if it's a change value (smaller number)
-                    elif abs(pct) < 50:  # Change values are typically small
-                        change = pct
+                if pct is not None and abs(pct) < 50:  # Change values are typically small
+                    change = pct
+                    break
             
             if price is not None:
-                instrument = MarketInstrument(
-                    symbol=symbol.upper(),
-                    name=name,
-                    value=price,
-                    change=change,
-                    pct_change=pct_change,
-                    category=MarketCategory.ETFS,
-                )
+                instrument = _validate_instrument({
+                    'symbol': symbol.upper(),
+                    'name': name,
+                    'value': price,
+                    'change': change,
+                    'pct_change': pct_change,
+                    'category': MarketCategory.ETFS,
+                })
                 instruments.append(instrument)
                 
         except (ValueError, TypeError, AttributeError, IndexError):
@@ -164,17 +197,21 @@ def parse_etfs_with_fallback(html: str, fallback_etfs: List[dict] = None) -> Lis
     instruments = parse_etfs(html)
     
     # If no ETFs found, use fallback data
-    if not instruments and fallback_etfs:
+    if not instruments and fallback_etfs is DEFAULT_ETFS:
+        # Shared prebuilt records carry the import time; stamp them for this run
+        stamp = {'timestamp': scrape_timestamp()}
+        instruments.extend(i.model_copy(update=stamp) for i in _DEFAULT_ETF_INSTRUMENTS)
+    elif not instruments and fallback_etfs:
         for etf_data in fallback_etfs:
             try:
-                instrument = MarketInstrument(
-                    symbol=etf_data.get('symbol', '').upper(),
-                    name=etf_data.get('name', f"{etf_data.get('symbol', '')} ETF"),
-                    value=etf_data.get('value', 0.0),
-                    change=etf_data.get('change'),
-                    pct_change=etf_data.get('pct_change'),
-                    category=MarketCategory.ETFS,
-                )
+                instrument = _validate_instrument({
+                    'symbol': etf_data.get('symbol', '').upper(),
+                    'name': etf_data.get('name', f"{etf_data.get('symbol', '')} ETF"),
+                    'value': etf_data.get('value', 0.0),
+                    'change': etf_data.get('change'),
+                    'pct_change': etf_data.get('pct_change'),
+                    'category': MarketCategory.ETFS,
+                })
                 instruments.append(instrument)
             except (ValueError, TypeError):
                 continue
@@ -201,6 +238,19 @@ DEFAULT_ETFS = [
     {"symbol": "TLT", "name": "iShares 20+ Year Treasury Bond ETF", "value": 92.15, "change": -0.30, "pct_change": -0.32},
 ]
 
+# Built once at import (shipped data, not re-validated); re-stamped per fallback call
+_DEFAULT_ETF_INSTRUMENTS = tuple(
+    MarketInstrument.build_trusted(
+        symbol=e['symbol'],
+        name=e['name'],
+        value=e['value'],
+        change=e['change'],
+        pct_change=e['pct_change'],
+        category=MarketCategory.ETFS,
+    )
+    for e in DEFAULT_ETFS
+)
+
 
 if __name__ == "__main__":
     # Test the parser
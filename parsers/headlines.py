@@ -1,17 +1,197 @@
 """
 Headlines Parser
 
-Parses news headlines and articles from HTML.
+Parses news headlines and articles from HTML using lxml.
 Extracts title, summary, timestamp, and URL into NewsArticle objects.
 """
 
-from typing import List, Optional
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from datetime import datetime
+from typing import Iterator, List, Optional, Union
+from datetime import datetime, timedelta
+from itertools import islice
 import re
+from urllib.parse import urljoin, urlsplit
+from lxml import etree
+from lxml.cssselect import CSSSelector, LxmlHTMLTranslator
+from lxml.html import HtmlElement
 
-from models import NewsArticle
+from models import NewsArticle, scrape_timestamp
+from parsers._lxml import TEXT_NODES, cell_text, parse_document
+
+
+_CONTAINER_TAGS = ('div', 'li', 'article')
+
+# Prefix for root-relative article links when the page has no <base href>
+_DEFAULT_BASE_URL = "https://tradingeconomics.com"
+
+# Datetime regexes, compiled once at import
+_RE_DIGITS = re.compile(r'(\d+)')
+_RE_ISO = re.compile(r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2})', re.IGNORECASE)
+_RE_HHMM = re.compile(r'(\d{1,2}:\d{2}(?:\s*[AaPp][Mm])?)', re.IGNORECASE)
+_RE_AGO = re.compile(r'(\d{1,2}\s*(?:hours?|hrs?|minutes?|mins?)\s*ago)', re.IGNORECASE)
+
+_TIME_PATTERNS = (
+    _RE_ISO,   # ISO-like
+    _RE_HHMM,  # Time only
+    _RE_AGO,   # Relative
+)
+
+# Datetime shapes for _parse_datetime, tried in order; digits are fed
+# straight into datetime() instead of looping over strptime formats.
+# Like strptime, only %Y accepts non-ASCII digits.
+_ISO_TZ_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+_SHAPE_YMD = re.compile(
+    r'^(?P<y>\d{4})-(?P<m>[0-9]{1,2})-(?P<d>[0-9]{1,2})'
+    r'(?:(?:[Tt]|\s+)(?P<H>[0-9]{1,2}):(?P<M>[0-9]{1,2}):(?P<S>[0-9]{1,2}))?$'
+)
+_SHAPE_YMD_TZ = re.compile(r'^\d{4}-[0-9]{1,2}-[0-9]{1,2}[Tt][0-9]{1,2}:[0-9]{1,2}:[0-9]{1,2}\S')
+_SHAPE_MONTH_DY = re.compile(
+    r'^(?P<b>[A-Za-z]+)\s+(?P<d>[0-9]{1,2}),\s+(?P<y>\d{4})'
+    r'(?:\s+(?P<H>[0-9]{1,2}):(?P<M>[0-9]{1,2}))?$'
+)
+_SHAPE_D_MONTH_Y = re.compile(
+    r'^(?P<d>[0-9]{1,2})\s+(?P<b>[A-Za-z]+)\s+(?P<y>\d{4})'
+    r'(?:\s+(?P<H>[0-9]{1,2}):(?P<M>[0-9]{1,2}))?$'
+)
+_SHAPE_SLASH = re.compile(
+    r'^(?P<a>[0-9]{1,2})/(?P<b>[0-9]{1,2})/(?P<y>\d{4})'
+    r'(?:\s+(?P<H>[0-9]{1,2}):(?P<M>[0-9]{1,2}))?$'
+)
+_SHAPE_DMY = re.compile(
+    r'^(?P<d>[0-9]{1,2})-(?P<m>[0-9]{1,2})-(?P<y>\d{4})'
+    r'(?:\s+(?P<H>[0-9]{1,2}):(?P<M>[0-9]{1,2}))?$'
+)
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Class substrings that mark a headline container (case-insensitive, like the old BS4 lambdas)
+_HEADLINE_CLASS_HINTS = (
+    'headline', 'news-item', 'article-item', 'news-article', 'headline-item',
+    'story', 'news-story', 'feed-item', 'post-preview',
+)
+
+# Headline containers and linked headings, matched in one document-order pass
+_HEADLINE_SEL = CSSSelector(
+    'article, '
+    + ', '.join(f'[class*="{hint}" i]' for hint in _HEADLINE_CLASS_HINTS)
+    + ', h1:has(a), h2:has(a), h3:has(a)'
+)
+
+# Fallback: links whose href looks like an article
+_NEWS_LINK_SEL = CSSSelector('a[href*="/news/"], a[href*="/article"], a[href*="/story"]')
+
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3'))
+
+# Section keywords for parse_all_news_categories (earnings take precedence)
+_EARNINGS_KWS = ('earning', 'quarterly results', 'q1', 'q2', 'q3', 'q4', 'eps')
+_DIVIDEND_KWS = ('dividend', 'payout', 'yield')
+# Characters carried between text nodes so keywords split across nodes still match
+_KW_OVERLAP = max(len(kw) for kw in _EARNINGS_KWS + _DIVIDEND_KWS) - 1
+
+
+def _descendant_selector(css: str) -> etree.XPath:
+    """Compile a CSS selector that matches descendants only (not the element itself)."""
+    return etree.XPath(LxmlHTMLTranslator().css_to_xpath(css, prefix='descendant::'))
+
+
+def _class_hints(tags: tuple, hints: tuple) -> str:
+    """CSS group matching any tag whose class contains any hint (case-insensitive)."""
+    return ', '.join(f'{tag}[class*="{hint}" i]' for tag in tags for hint in hints)
+
+
+# Class-substring lookups, compiled once (evaluated inside libxml2)
+_SOURCE_SEL = _descendant_selector(_class_hints(('span', 'div', 'a'), ('source',)))
+_CATEGORY_SEL = _descendant_selector(_class_hints(('span', 'div', 'a'), ('category', 'tag', 'topic')))
+_NEWS_SECTION_SEL = CSSSelector(_class_hints(('section', 'div'), ('news', 'headlines', 'articles', 'stories')))
+_SECTION_ARTICLE_SEL = _descendant_selector(
+    _class_hints(('article', 'div', 'li'), ('item', 'article', 'story', 'post', 'headline'))
+)
+
+
+def _find_parent(element: HtmlElement, *tags: str) -> Optional[HtmlElement]:
+    """Nearest ancestor with one of the given tag names."""
+    return next(element.iterancestors(*tags), None)
+
+
+def _classify_section(section: HtmlElement) -> str:
+    """Pick a news category from a section's text, stopping at the first earnings keyword."""
+    category = "market_headlines"
+    carry = ""
+    for text in TEXT_NODES(section):
+        text = text.strip()
+        if not text:
+            continue
+        window = carry + text.lower()
+        if any(kw in window for kw in _EARNINGS_KWS):
+            return "earnings_announcements"
+        if category == "market_headlines" and any(kw in window for kw in _DIVIDEND_KWS):
+            category = "dividend_news"
+        carry = window[-_KW_OVERLAP:]
+    return category
+
+
+def _document_base_url(tree: HtmlElement) -> str:
+    """Resolve the document's <base href> once (default site URL if absent)."""
+    base_tag = tree.find('.//base[@href]')
+    if base_tag is not None:
+        return base_tag.get('href')
+    return _DEFAULT_BASE_URL
+
+
+def _build_datetime(y: str, m: Union[str, int], d: str, hour: Optional[str] = None,
+                    minute: Optional[str] = None, second: Optional[str] = None) -> Optional[datetime]:
+    """Build a datetime from captured digit groups (None if out of range)."""
+    try:
+        return datetime(int(y), int(m), int(d), int(hour or 0), int(minute or 0), int(second or 0))
+    except ValueError:
+        return None
+
+
+def _parse_absolute_datetime(value: str) -> Optional[datetime]:
+    """Parse the ISO, named-month, slash and dash date shapes."""
+    # Fast path: zero-padded "YYYY-MM-DD" / "YYYY-MM-DDTHH:MM:SS" go straight to the C parser
+    if value[4:5] == '-' and value[7:8] == '-' and (
+        len(value) == 10
+        or (len(value) == 19 and value[10] in 'Tt ' and value[13] == ':' and value[16] == ':')
+    ):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    
+    match = _SHAPE_YMD.match(value)
+    if match:
+        return _build_datetime(*match.group('y', 'm', 'd', 'H', 'M', 'S'))
+    
+    # ISO with timezone: rare, so let strptime handle the offset forms
+    if _SHAPE_YMD_TZ.match(value):
+        try:
+            return datetime.strptime(value, _ISO_TZ_FORMAT)
+        except ValueError:
+            return None
+    
+    for shape in (_SHAPE_MONTH_DY, _SHAPE_D_MONTH_Y):
+        match = shape.match(value)
+        if match:
+            month = _MONTHS.get(match.group('b').lower())
+            if month is None:
+                return None
+            return _build_datetime(match.group('y'), month, *match.group('d', 'H', 'M'))
+    
+    match = _SHAPE_SLASH.match(value)
+    if match:
+        y, a, b, hour, minute = match.group('y', 'a', 'b', 'H', 'M')
+        # Month-first, then day-first
+        return _build_datetime(y, a, b, hour, minute) or _build_datetime(y, b, a, hour, minute)
+    
+    match = _SHAPE_DMY.match(value)
+    if match:
+        return _build_datetime(*match.group('y', 'm', 'd', 'H', 'M'))
+    
+    return None
 
 
 def _parse_datetime(value: str) -> Optional[datetime]:
@@ -21,89 +201,65 @@ def _parse_datetime(value: str) -> Optional[datetime]:
     
     value = value.strip()
     
-    # Common formats to try
-    formats = [
-        "%Y-%m-%dT%H:%M:%S%z",      # ISO with timezone
-        "%Y-%m-%dT%H:%M:%S",         # ISO without timezone
-        "%Y-%m-%d %H:%M:%S",         # Space separator
-        "%Y-%m-%d",                  # Date only
-        "%B %d, %Y %H:%M",           # "January 15, 2024 14:30"
-        "%B %d, %Y",                 # "January 15, 2024"
-        "%d %B %Y %H:%M",            # "15 January 2024 14:30"
-        "%d %B %Y",                  # "15 January 2024"
-        "%m/%d/%Y %H:%M",            # "01/15/2024 14:30"
-        "%m/%d/%Y",                  # "01/15/2024"
-        "%d/%m/%Y %H:%M",            # "15/01/2024 14:30"
-        "%d/%m/%Y",                  # "15/01/2024"
-        "%d-%m-%Y %H:%M",            # "15-01-2024 14:30"
-        "%d-%m-%Y",                  # "15-01-2024"
-    ]
-    
-    # Try parsing with various formats
-    for fmt in formats:
-        try:
-            return datetime.strptime(value, fmt)
-        except ValueError:
-            continue
+    # Known absolute shapes
+    dt = _parse_absolute_datetime(value)
+    if dt:
+        return dt
     
     # Handle relative time like "2 hours ago", "Yesterday", etc.
     now = datetime.now()
     value_lower = value.lower()
     
-    if 'hour' in value_lower or 'hr' in value_lower:
-        match = re.search(r'(\d+)', value)
-        if match:
-            hours = int(match.group(1))
-            return now.replace(minute=0, second=0, microsecond=0)
-    
-    if 'minute' in value_lower or 'min' in value_lower:
-        match = re.search(r'(\d+)', value)
-        if match:
-            minutes = int(match.group(1))
-            return now.replace(second=0, microsecond=0)
-    
-    if 'yesterday' in value_lower:
-        return now.replace(day=now.day - 1, hour=0, minute=0, second=0, microsecond=0)
-    
-    if 'day' in value_lower:
-        match = re.search(r'(\d+)', value)
-        if match:
-            days = int(match.group(1))
-            return now.replace(day=now.day - days, hour=0, minute=0, second=0, microsecond=0)
+    match = _RE_DIGITS.search(value)
+    try:
+        if 'hour' in value_lower or 'hr' in value_lower:
+            if match:
+                hours = int(match.group(1))
+                return (now - timedelta(hours=hours)).replace(minute=0, second=0, microsecond=0)
+        
+        if 'minute' in value_lower or 'min' in value_lower:
+            if match:
+                minutes = int(match.group(1))
+                return (now - timedelta(minutes=minutes)).replace(second=0, microsecond=0)
+        
+        if 'yesterday' in value_lower:
+            return (now - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        if 'day' in value_lower:
+            if match:
+                days = int(match.group(1))
+                return (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    except OverflowError:
+        # Offset reaches past datetime.min
+        return None
     
     return None
 
 
-def _extract_timestamp_from_element(element: Tag) -> Optional[datetime]:
+def _extract_timestamp_from_element(element: HtmlElement) -> Optional[datetime]:
     """Try to extract timestamp from element attributes or children."""
     # Check common attributes
     for attr in ['data-time', 'datetime', 'timestamp', 'pubdate']:
-        if element.has_attr(attr):
-            dt = _parse_datetime(element[attr])
+        if element.get(attr) is not None:
+            dt = _parse_datetime(element.get(attr))
             if dt:
                 return dt
     
     # Check for time tag
-    time_tag = element.find('time')
-    if time_tag and time_tag.has_attr('datetime'):
-        dt = _parse_datetime(time_tag['datetime'])
+    time_tag = element.find('.//time')
+    if time_tag is not None and time_tag.get('datetime') is not None:
+        dt = _parse_datetime(time_tag.get('datetime'))
         if dt:
             return dt
         # Check datetime attribute
-        dt = _parse_datetime(time_tag.get_text(strip=True))
+        dt = _parse_datetime(cell_text(time_tag))
         if dt:
             return dt
     
     # Look for time-like text in element
-    text = element.get_text(strip=True)
-    time_patterns = [
-        r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2})',  # ISO-like
-        r'(\d{1,2}:\d{2}(?:\s*[AaPp][Mm])?)',    # Time only
-        r'(\d{1,2}\s*(?:hours?|hrs?|minutes?|mins?)\s*ago)',  # Relative
-    ]
-    
-    for pattern in time_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    text = cell_text(element)
+    for pattern in _TIME_PATTERNS:
+        match = pattern.search(text)
         if match:
             dt = _parse_datetime(match.group(1))
             if dt:
@@ -112,152 +268,100 @@ def _extract_timestamp_from_element(element: Tag) -> Optional[datetime]:
     return None
 
 
-def _find_headline_articles(soup: BeautifulSoup) -> List[Tag]:
-    """Find all headline article elements."""
-    # Strategy 1: Look for article tags
-    articles = soup.find_all('article')
-    if articles:
-        return articles
-    
-    # Strategy 2: Look for common headline classes
-    headline_classes = [
-        'headline',
-        'news-item',
-        'article-item',
-        'news-article',
-        'headline-item',
-        'story',
-        'news-story',
-        'feed-item',
-        'post-preview',
-    ]
+def _iter_headline_articles(tree: HtmlElement) -> Iterator[HtmlElement]:
+    """Yield headline article elements lazily, in document order."""
+    selected = set()
     
-    for cls in headline_classes:
-        elements = soup.find_all(class_=lambda c: c and cls in str(c).lower())
-        if elements:
-            return elements
-    
-    # Strategy 3: Look for h1, h2, h3 with links (headline pattern)
-    headline_tags = soup.find_all(['h1', 'h2', 'h3'])
-    headlines = []
-    for tag in headline_tags:
-        if tag.find('a') and len(tag.get_text(strip=True)) > 10:
-            # Get parent article/container
-            parent = tag.find_parent(['div', 'section', 'article', 'li'])
-            if parent and parent not in headlines:
-                headlines.append(parent)
-    
-    if headlines:
-        return headlines
-    
-    # Strategy 4: Look for links in news sections
-    news_sections = soup.find_all(string=lambda t: t and 'news' in t.lower())
-    for section_text in news_sections:
-        parent = section_text.find_parent()
-        if parent:
-            links = parent.find_all('a')
-            if links:
-                containers = []
-                for link in links[:5]:  # Limit to first 5
-                    container = link.find_parent(['div', 'li', 'article'])
-                    if container and container not in containers:
-                        containers.append(container)
-                if containers:
-                    return containers
+    for node in _HEADLINE_SEL(tree):
+        if node.tag in _HEADING_TAGS:
+            # Linked heading: use its parent article/container
+            if len(cell_text(node)) <= 10:
+                continue
+            node = _find_parent(node, 'div', 'section', 'article', 'li')
+            if node is None:
+                continue
+        # Skip duplicates and matches nested inside an already selected container
+        if node in selected or any(parent in selected for parent in node.iterancestors()):
+            continue
+        selected.add(node)
+        yield node
     
-    # Fallback: Return all links that look like articles
-    all_links = soup.find_all('a', href=lambda h: h and any(x in h for x in ['/news/', '/article', '/story', '/2024', '/2025']))
-    if all_links:
-        containers = []
-        for link in all_links[:5]:
-            container = link.find_parent(['div', 'li', 'article'])
-            if container and container not in containers:
-                containers.append(container)
-        if containers:
-            return containers
+    if selected:
+        return
     
-    return []
+    # Fallback: containers of links that look like articles
+    for link in _NEWS_LINK_SEL(tree)[:5]:
+        container = _find_parent(link, *_CONTAINER_TAGS)
+        if container is not None and container not in selected:
+            selected.add(container)
+            yield container
 
 
-def _extract_article_from_element(element: Tag) -> Optional[NewsArticle]:
-    """Extract NewsArticle data from an article element."""
+def _extract_article_from_element(element: HtmlElement, base_url: str) -> Optional[NewsArticle]:
+    """Extract NewsArticle data from an article element (links resolve against base_url)."""
     try:
+        # Find URL first: blocks without a usable link are skipped before any text work
+        url = None
+        link = element.find('.//a[@href]')
+        if link is not None:
+            href = link.get('href').strip()
+            # Make absolute URL (fragment-only links point back at the page)
+            if href and not href.startswith('#'):
+                url = urljoin(base_url, href)
+                if urlsplit(url).scheme not in ('http', 'https'):
+                    url = None
+        
+        if not url:
+            return None
+        
         # Find title - look for h1, h2, h3, or strong text
         title = None
         for tag in ['h1', 'h2', 'h3', 'h4']:
-            title_elem = element.find(tag)
-            if title_elem:
-                title = title_elem.get_text(strip=True)
+            title_elem = element.find('.//' + tag)
+            if title_elem is not None:
+                title = cell_text(title_elem)
                 break
         
         # If no heading, try first substantial text
         if not title:
-            text_elem = element.find(['strong', 'b', '.title', '.headline'])
-            if text_elem:
-                title = text_elem.get_text(strip=True)
+            text_elem = next(element.iterdescendants('strong', 'b'), None)
+            if text_elem is not None:
+                title = cell_text(text_elem)
         
         if not title:
-            # Last resort: use link text
-            link = element.find('a')
-            if link:
-                title = link.get_text(strip=True)
+            # Last resort: use the first link's text (the URL probe found at least one)
+            title = cell_text(element.find('.//a'))
         
         if not title or len(title) < 5:
             return None
         
-        # Find URL
-        url = None
-        link = element.find('a', href=True)
-        if link:
-            href = link['href']
-            # Make absolute URL
-            if href.startswith('/'):
-                # Try to find base URL
-                base = element.find_parent('html')
-                if base:
-                    base_tag = base.find('base', href=True)
-                    if base_tag:
-                        url = base_tag['href'] + href
-                    else:
-                        # Use a reasonable default
-                        url = f"https://tradingeconomics.com{href}"
-                else:
-                    url = f"https://tradingeconomics.com{href}"
-            elif href.startswith('http'):
-                url = href
-        
-        if not url:
-            return None
-        
-        # Find summary - look for paragraph, div, or excerpt
+        # Find summary - first paragraph
         summary = None
-        for tag in ['p', '.summary', '.excerpt', '.description', '.snippet']:
-            elem = element.find(tag)
-            if elem:
-                summary = elem.get_text(strip=True)
-                # Limit summary length
-                if summary and len(summary) > 500:
-                    summary = summary[:497] + "..."
-                break
+        elem = element.find('.//p')
+        if elem is not None:
+            summary = cell_text(elem)
+            # Limit summary length
+            if summary and len(summary) > 500:
+                summary = summary[:497] + "..."
         
         # Find timestamp
         timestamp = _extract_timestamp_from_element(element)
         if not timestamp:
-            timestamp = datetime.utcnow()
+            timestamp = scrape_timestamp()
         
         # Extract source if available
         source = None
-        source_elem = element.find(['span', 'div', 'a'], class_=lambda c: c and 'source' in str(c).lower())
-        if source_elem:
-            source = source_elem.get_text(strip=True)
+        source_elems = _SOURCE_SEL(element)
+        if source_elems:
+            source = cell_text(source_elems[0])
         
         # Extract category if available
         category = None
-        cat_elem = element.find(['span', 'div', 'a'], class_=lambda c: c and any(x in str(c).lower() for x in ['category', 'tag', 'topic']))
-        if cat_elem:
-            category = cat_elem.get_text(strip=True)
+        cat_elems = _CATEGORY_SEL(element)
+        if cat_elems:
+            category = cell_text(cat_elems[0])
         
-        return NewsArticle(
+        return NewsArticle.build_trusted(
             title=title,
             summary=summary,
             timestamp=timestamp,
@@ -281,17 +385,20 @@ def parse_headlines(html: str, limit: int = 3) -> List[NewsArticle]:
         List of NewsArticle objects (may be fewer than limit if unavailable)
     """
     articles = []
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
+    if tree is None:
+        return articles
     
-    # Remove unwanted elements (ads, scripts, styles)
-    for tag in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-        tag.decompose()
+    # Empty out unwanted elements (ads, scripts, styles); clearing in place
+    # keeps the following text as its own node, as decompose() did
+    for tag in list(tree.iter('script', 'style', 'nav', 'header', 'footer', 'aside')):
+        tag.clear(keep_tail=True)
     
-    # Find all headline elements
-    headline_elements = _find_headline_articles(soup)
+    # Only the first `limit` headline elements are located and extracted
+    base_url = _document_base_url(tree)
     
-    for element in headline_elements[:limit]:
-        article = _extract_article_from_element(element)
+    for element in islice(_iter_headline_articles(tree), max(limit, 0)):
+        article = _extract_article_from_element(element, base_url)
         if article:
             articles.append(article)
     
@@ -305,7 +412,7 @@ def parse_all_news_categories(html: str) -> dict:
     Returns:
         dict with keys: 'market_headlines', 'earnings_announcements', 'dividend_news'
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
     
     result = {
         "market_headlines": [],
@@ -313,28 +420,23 @@ def parse_all_news_categories(html: str) -> dict:
         "dividend_news": [],
     }
     
+    if tree is None:
+        return result
+    
+    base_url = _document_base_url(tree)
+    
     # Find main news sections
-    news_sections = soup.find_all(['section', 'div'], class_=lambda c: c and any(
-        x in str(c).lower() for x in ['news', 'headlines', 'articles', 'stories']
-    ))
+    news_sections = _NEWS_SECTION_SEL(tree)
     
     for section in news_sections:
-        section_text = section.get_text(strip=True).lower()
-        
         # Determine category
-        category = "market_headlines"
-        if any(x in section_text for x in ['earning', 'quarterly results', 'q1', 'q2', 'q3', 'q4', 'eps']):
-            category = "earnings_announcements"
-        elif any(x in section_text for x in ['dividend', 'payout', 'yield']):
-            category = "dividend_news"
+        category = _classify_section(section)
         
         # Parse articles in this section
-        articles = section.find_all(['article', 'div', 'li'], class_=lambda c: c and any(
-            x in str(c).lower() for x in ['item', 'article', 'story', 'post', 'headline']
-        ))
+        articles = _SECTION_ARTICLE_SEL(section)
         
         for elem in articles[:5]:  # Limit per section
-            article = _extract_article_from_element(elem)
+            article = _extract_article_from_element(elem, base_url)
             if article:
                 result[category].append(article)
     
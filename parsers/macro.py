@@ -1,18 +1,66 @@
 """
 Macro Indicators Parser
 
-Parses macroeconomic indicators for 13 major countries from HTML matrix.
+Parses macroeconomic indicators for 13 major countries from HTML matrix using lxml.
 Returns Dict[str, List[MacroIndicator]] keyed by ISO country code.
 
 Countries: US, UK, EU, JP, CN, DE, FR, IT, ES, CA, AU, BR, IN
 Indicators: GDP, Inflation, Unemployment, Interest Rate, PMI, etc.
 """
 
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-
-from models import MacroIndicator, CountryCode
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+import hashlib
+import io
+import re
+import sys
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+
+from models import MacroIndicator, CountryCode, scrape_timestamp
+from parsers._lxml import cell_text, parse_document
+
+
+# Previous value inside an indicator cell: "1.5 (1.4)", "1.5 vs 1.4", "Previous: 1.4"
+_PREV_RE = re.compile(r'\(([\d.\-]+)\)|vs\s*([\d.\-]+)|previous[:\s]*([\d.\-]+)', re.IGNORECASE)
+
+# Update frequency keywords, one lookahead per tier tried in priority order
+# (quarterly > yearly > weekly > daily); the named group that matched is the
+# frequency, so a name mentioning both "GDP" and "annual" is still quarterly
+_FREQUENCY_RE = re.compile(
+    r'(?:(?=.*(?:gdp|quarterly|q[1-4]))(?P<quarterly>)'
+    r'|(?=.*(?:annual|yearly|yoy))(?P<yearly>)'
+    r'|(?=.*weekly)(?P<weekly>)'
+    r'|(?=.*(?:daily|today))(?P<daily>))',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Every text and comment node in document order (BS4 find_all(string=...));
+# a single axis step, since a '|' union makes libxml2 sort the merged node-set
+_ALL_STRINGS = etree.XPath('/descendant::node()[self::text() or self::comment()]')
+
+# Rows of a table/section and cells of a row (descendants, document order)
+_ROWS_XP = etree.XPath('.//tr')
+_CELLS_XP = etree.XPath('.//td | .//th')
+
+# Class-based fallbacks for the country table, in priority order
+_MACRO_TABLE_SELECTORS = tuple(CSSSelector(selector) for selector in (
+    '.macro-table',
+    '.indicators-table',
+    '.country-indicators',
+    '.macro-data',
+    '[class*="macro"]',
+    '[class*="indicators"]',
+))
+
+# Containers whose class mentions a country/nation/region (case-insensitive)
+_COUNTRY_SECTION_SEL = CSSSelector(', '.join(
+    f'{tag}[class*="{hint}" i]'
+    for tag in ('div', 'section', 'article')
+    for hint in ('country', 'nation', 'region')
+))
 
 
 # Common macro indicators across all countries
@@ -40,6 +88,37 @@ DEFAULT_MACRO_INDICATORS = [
 ]
 
 
+# Common indicator name variations (lowercased) -> canonical name; the
+# canonical strings are interned so every indicator shares one copy
+_NAME_CANON = {
+    variant: sys.intern(canonical)
+    for variant, canonical in {
+        "gdp yoy": "GDP Growth",
+        "gdp growth rate": "GDP Growth",
+        "annual gdp growth": "GDP Growth",
+        "cpi inflation": "Inflation Rate",
+        "consumer price index": "Inflation Rate",
+        "inflation yoy": "Inflation Rate",
+        "unemployment rate": "Unemployment Rate",
+        "jobless rate": "Unemployment Rate",
+        "policy rate": "Interest Rate",
+        "central bank rate": "Interest Rate",
+        "manufacturing pmi": "Manufacturing PMI",
+        "pmi manufacturing": "Manufacturing PMI",
+        "consumer confidence index": "Consumer Confidence",
+        "retail sales yoy": "Retail Sales",
+        "industrial production yoy": "Industrial Production",
+        "trade balance yoy": "Trade Balance",
+        "govt debt gdp": "Government Debt to GDP",
+        "public debt gdp": "Government Debt to GDP",
+        "current account balance": "Current Account",
+        "housing starts yoy": "Housing Starts",
+        "ppi": "Producer Price Index",
+        "business climate": "Business Confidence",
+    }.items()
+}
+
+
 # Country name mappings (HTML often uses full names)
 COUNTRY_NAME_MAP = {
     "united states": CountryCode.US,
@@ -67,123 +146,197 @@ COUNTRY_NAME_MAP = {
 }
 
 
+# parse_macro_indicators results keyed by a blake2b digest of the page (not
+# the page itself, so large HTML is not kept alive by the cache)
+_MACRO_CACHE_SIZE = 32
+_MACRO_CACHE: "OrderedDict[bytes, Dict[str, Tuple[MacroIndicator, ...]]]" = OrderedDict()
+
+
+# Countries parsed from the macro page, in lookup order
+_MACRO_COUNTRIES = (
+    ("United States", CountryCode.US),
+    ("United Kingdom", CountryCode.UK),
+    ("European Union", CountryCode.EU),
+    ("Euro Area", CountryCode.EU),
+    ("Japan", CountryCode.JP),
+    ("China", CountryCode.CN),
+    ("Germany", CountryCode.DE),
+    ("France", CountryCode.FR),
+    ("Italy", CountryCode.IT),
+    ("Spain", CountryCode.ES),
+    ("Canada", CountryCode.CA),
+    ("Australia", CountryCode.AU),
+    ("Brazil", CountryCode.BR),
+    ("India", CountryCode.IN),
+)
+
+
+def _country_alternation(keys) -> "re.Pattern[str]":
+    """Whole-word alternation over lowercase keys (longest first)."""
+    alternation = "|".join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+    return re.compile(r"\b(?:" + alternation + r")\b")
+
+
+# Section titles (lowercased): one search against every COUNTRY_NAME_MAP key
+_COUNTRY_RE = _country_alternation(COUNTRY_NAME_MAP)
+
+# Matrix rows (lowercased): country names and ISO codes -> CountryCode
+_MATRIX_COUNTRY_LOOKUP = {name.lower(): code for name, code in _MACRO_COUNTRIES}
+for _name, _code in _MACRO_COUNTRIES:
+    _MATRIX_COUNTRY_LOOKUP.setdefault(_code.value.lower(), _code)
+_MATRIX_COUNTRY_RE = _country_alternation(_MATRIX_COUNTRY_LOOKUP)
+
+# Characters dropped from numeric cells (currency, %, unicode minus/en dash,
+# parentheses, thousands separators, spaces and NBSP)
+_NUMBER_STRIP = str.maketrans('', '', '$€£¥%−–(), \xa0')
+
+# Unit hints inside a lowercased value cell
+_BILLIONS_WORDS = ('bln', 'bn', 'billion', 'trillion')
+_YOY_WORDS = ('yoy', 'year')
+
+# Separators between name and value when a row has a single cell
+_ROW_SEPARATORS = ('......', '—', '--', '→', '|', '\t')
+
+# Trailing unit after a space (matched against the lowercased value)
+_UNIT_SUFFIX_RE = re.compile(r' (?:%|bps|basis points|bln|bn|billion|trillion|t)$')
+
+
+@lru_cache(maxsize=4096)
 def _parse_number(value: str) -> Optional[float]:
     """Parse a number string to float (handles %, billions, etc.)."""
-    if not value or not value.strip():
+    if not value:
         return None
+    # Remove common prefixes/suffixes and spaces in one pass
+    cleaned = value.translate(_NUMBER_STRIP).strip()
     try:
-        cleaned = value.strip()
-        # Remove common prefixes/suffixes
-        for char in ['$', '€', '£', '¥', '%', '−', '–', '−', '(', ')', ',']:
-            cleaned = cleaned.replace(char, '')
-        cleaned = cleaned.replace(' ', '')
-        # Handle "n/a" or similar
-        if cleaned.lower() in ['n/a', 'na', 'n.a.', '-', '...', '']:
-            return None
         return float(cleaned)
-    except (ValueError, TypeError):
+    except ValueError:
+        # Blank, "n/a", "-", "..." and other placeholders
         return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_indicator_value(value: str) -> Optional[float]:
     """Parse indicator value with unit awareness."""
     if not value or not value.strip():
         return None
     cleaned = value.strip()
     # Remove unit if present
-    for suffix in ['%', 'bps', 'basis points', 'bln', 'bn', 'billion', 'trillion', 't']:
-        if cleaned.lower().endswith(' ' + suffix):
-            cleaned = cleaned[:-len(suffix)-1]
-            break
+    lowered = cleaned.lower()
+    unit = _UNIT_SUFFIX_RE.search(lowered)
+    if unit:
+        cleaned = cleaned[:unit.start() - len(lowered)]
     return _parse_number(cleaned)
 
 
+@lru_cache(maxsize=1024)
 def _clean_indicator_name(name: str) -> str:
     """Clean and standardize indicator name."""
     name = name.strip()
     # Normalize common variations
-    mappings = {
-        "gdp yoy": "GDP Growth",
-        "gdp growth rate": "GDP Growth",
-        "annual gdp growth": "GDP Growth",
-        "cpi inflation": "Inflation Rate",
-        "consumer price index": "Inflation Rate",
-        "inflation yoy": "Inflation Rate",
-        "unemployment rate": "Unemployment Rate",
-        "jobless rate": "Unemployment Rate",
-        "policy rate": "Interest Rate",
-        "central bank rate": "Interest Rate",
-        "manufacturing pmi": "Manufacturing PMI",
-        "pmi manufacturing": "Manufacturing PMI",
-        "consumer confidence index": "Consumer Confidence",
-        "retail sales yoy": "Retail Sales",
-        "industrial production yoy": "Industrial Production",
-        "trade balance yoy": "Trade Balance",
-        "govt debt gdp": "Government Debt to GDP",
-        "public debt gdp": "Government Debt to GDP",
-        "current account balance": "Current Account",
-        "housing starts yoy": "Housing Starts",
-        "ppi": "Producer Price Index",
-        "business climate": "Business Confidence",
-    }
-    return mappings.get(name.lower(), name)
+    return _NAME_CANON.get(name.lower(), name)
 
 
-def _find_macro_table(soup: BeautifulSoup, country: str) -> Optional[Tag]:
+def _row_cells(row: HtmlElement) -> List[HtmlElement]:
+    """All td/th cells within a row."""
+    return _CELLS_XP(row)
+
+
+def _table_header_texts(tree: HtmlElement) -> List[Tuple[HtmlElement, List[str]]]:
+    """Collect every table with its lower-cased header texts (computed once per page)."""
+    return [
+        (table, [cell_text(header).lower() for header in table.iterdescendants('th')])
+        for table in tree.iter('table')
+    ]
+
+
+def _find_macro_table(
+    tree: HtmlElement,
+    country: str,
+    table_headers: Optional[List[Tuple[HtmlElement, List[str]]]] = None,
+) -> Optional[HtmlElement]:
     """Find the macro indicators table for a specific country."""
+    return _find_macro_tables(tree, (country,), table_headers)[country]
+
+
+def _find_macro_tables(
+    tree: HtmlElement,
+    countries: Sequence[str],
+    table_headers: Optional[List[Tuple[HtmlElement, List[str]]]] = None,
+) -> Dict[str, Optional[HtmlElement]]:
+    """Find the macro indicators table for several countries in one sweep of the page."""
     # Try multiple selector strategies
+    if table_headers is None:
+        table_headers = _table_header_texts(tree)
+    
+    found: Dict[str, Optional[HtmlElement]] = {}
+    pending: Dict[str, str] = {}
     
     # Strategy 1: Find table with country header
-    tables = soup.find_all('table')
-    for table in tables:
-        headers = table.find_all('th')
-        for header in headers:
-            if country.lower() in header.get_text(strip=True).lower():
-                return table
+    for country in countries:
+        country_lower = country.lower()
+        for table, headers in table_headers:
+            if any(country_lower in header for header in headers):
+                found[country] = table
+                break
+        else:
+            pending[country] = country_lower
     
-    # Strategy 2: Find by country name in page
-    country_elements = soup.find_all(string=lambda t: t and country.lower() in t.lower())
-    for elem in country_elements:
-        parent = elem.find_parent()
-        if parent:
-            table = parent.find_parent('table')
-            if table:
-                return table
-            # Look for table nearby
-            for sibling in parent.find_next_siblings():
-                if sibling.name == 'table':
-                    return sibling
+    # Strategy 2: Find by country name in page (one pass for every pending country)
+    if pending:
+        for node in _ALL_STRINGS(tree):
+            if isinstance(node, str):
+                text = node
+                owner = node.getparent()
+                parent = owner.getparent() if node.is_tail else owner
+            else:
+                text = node.text
+                parent = node.getparent()
+            if not text or parent is None:
+                continue
+            text_lower = text.lower()
+            matched = [country for country, country_lower in pending.items() if country_lower in text_lower]
+            if not matched:
+                continue
+            table = next(parent.iterancestors('table'), None)
+            if table is None:
+                # Look for table nearby
+                table = next(parent.itersiblings('table'), None)
+            if table is None:
+                continue
+            for country in matched:
+                found[country] = table
+                del pending[country]
+            if not pending:
+                break
     
     # Strategy 3: Look for common macro table classes
-    macro_selectors = [
-        '.macro-table',
-        '.indicators-table',
-        '.country-indicators',
-        '.macro-data',
-        '[class*="macro"]',
-        '[class*="indicators"]',
-    ]
-    for selector in macro_selectors:
-        table = soup.select_one(selector)
-        if table:
-            return table
+    if pending:
+        fallback = None
+        for selector in _MACRO_TABLE_SELECTORS:
+            matches = selector(tree)
+            if matches:
+                fallback = matches[0]
+                break
+        for country in pending:
+            found[country] = fallback
     
-    return None
+    return found
 
 
-def _extract_indicator_row(row: Tag) -> Dict[str, str]:
+def _extract_indicator_row(row: HtmlElement) -> Dict[str, str]:
     """Extract indicator name and value from a table row."""
-    cells = row.find_all(['td', 'th'])
+    cells = _row_cells(row)
     if len(cells) >= 2:
-        name = cells[0].get_text(strip=True)
+        name = cell_text(cells[0])
         # Try to get value from second cell, or next sibling
-        value = cells[1].get_text(strip=True)
+        value = cell_text(cells[1])
         return {"name": name, "value": value}
     elif len(cells) == 1:
         # Might be split across multiple elements
-        text = cells[0].get_text(strip=True)
+        text = cell_text(cells[0])
         # Try to split on common separators
-        for sep in ['......', '—', '--', '→', '|', '\t']:
+        for sep in _ROW_SEPARATORS:
             if sep in text:
                 parts = text.split(sep)
                 return {"name": parts[0].strip(), "value": parts[-1].strip()}
@@ -204,16 +357,12 @@ def _determine_actual(value: str, forecast: Optional[float]) -> Optional[str]:
         return "worse"
 
 
+@lru_cache(maxsize=1024)
 def _determine_frequency(name: str) -> str:
     """Determine update frequency based on indicator name."""
-    if any(word in name.lower() for word in ['gdp', 'quarterly', 'q1', 'q2', 'q3', 'q4']):
-        return "quarterly"
-    elif any(word in name.lower() for word in ['annual', 'yearly', 'yoy']):
-        return "yearly"
-    elif any(word in name.lower() for word in ['weekly', 'weekly']:
-        return "weekly"
-    elif any(word in name.lower() for word in ['daily', 'today']):
-        return "daily"
+    match = _FREQUENCY_RE.match(name)
+    if match:
+        return match.lastgroup
     return "monthly"
 
 
@@ -233,15 +382,17 @@ def parse_country_macro(
     Returns:
         List of MacroIndicator objects
     """
-    indicators = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    table = _find_macro_table(soup, country)
-    if not table:
-        return indicators
+    tree = parse_document(html)
+    if tree is None:
+        return []
+    return _parse_country_macro_from_tree(tree, country, country_code)
+
+
+def _indicator_row_fields(table: HtmlElement) -> List[Dict[str, Any]]:
+    """Read a macro table's name/value rows once into country-independent indicator fields."""
+    rows = []
     
-    rows = table.find_all('tr')
-    for row in rows:
+    for row in _ROWS_XP(table):
         try:
             data = _extract_indicator_row(row)
             name = data.get("name", "")
@@ -256,32 +407,55 @@ def parse_country_macro(
             # Try to extract previous value (often in parentheses or next column)
             previous = None
             # Check for pattern like "1.5 (1.4)" or "1.5 vs 1.4"
-            import re
-            prev_match = re.search(r'\(([\d\.\-]+)\)|vs\s*([\d\.\-]+)|previous[:\s]*([\d\.\-]+)', value_str)
+            prev_match = _PREV_RE.search(value_str)
             if prev_match:
                 prev_str = prev_match.group(1) or prev_match.group(2) or prev_match.group(3)
                 previous = _parse_number(prev_str)
             
             # Determine unit from context
             unit = "%"
-            if any(word in value_str.lower() for word in ['bln', 'bn', 'billion', 'trillion']):
+            value_lower = value_str.lower()
+            if any(word in value_lower for word in _BILLIONS_WORDS):
                 unit = "billions"
-            elif 'yoy' in value_str.lower() or 'year' in value_str.lower():
+            elif any(word in value_lower for word in _YOY_WORDS):
                 unit = "% YoY"
             
-            indicator = MacroIndicator(
-                country=country_code,
-                indicator_name=name,
-                value=value,
-                previous=previous,
-                unit=unit,
-                frequency=_determine_frequency(name),
-            )
-            indicators.append(indicator)
+            rows.append({
+                "indicator_name": name,
+                "value": value,
+                "previous": previous,
+                "unit": unit,
+                "frequency": _determine_frequency(name),
+            })
         except (ValueError, TypeError, AttributeError):
             continue
     
-    return indicators
+    return rows
+
+
+def _parse_indicator_rows(
+    table: HtmlElement,
+    country_code: CountryCode,
+    row_fields: Optional[List[Dict[str, Any]]] = None,
+) -> List[MacroIndicator]:
+    """Build one indicator per name/value row of a country's macro table."""
+    if row_fields is None:
+        row_fields = _indicator_row_fields(table)
+    return [MacroIndicator.build_trusted(country=country_code, **fields) for fields in row_fields]
+
+
+def _parse_country_macro_from_tree(
+    tree: HtmlElement,
+    country: str,
+    country_code: CountryCode,
+    table_headers: Optional[List[Tuple[HtmlElement, List[str]]]] = None,
+) -> List[MacroIndicator]:
+    """Parse one country's indicators from an already parsed page."""
+    table = _find_macro_table(tree, country, table_headers)
+    if table is None:
+        return []
+    
+    return _parse_indicator_rows(table, country_code)
 
 
 def parse_macro_indicators(html: str) -> Dict[str, List[MacroIndicator]]:
@@ -294,7 +468,68 @@ def parse_macro_indicators(html: str) -> Dict[str, List[MacroIndicator]]:
     Returns:
         Dict mapping country code (str) to List[MacroIndicator]
         Keys: "US", "UK", "EU", "JP", "CN", "DE", "FR", "IT", "ES", "CA", "AU", "BR", "IN"
+    
+    Results are cached by a digest of the HTML, so an unchanged page is only
+    parsed once; cache hits are re-stamped with the current scrape timestamp.
+    The cache is per process: when this runs in a worker pool, look it up in
+    the parent with cached_macro_indicators()/cache_macro_indicators().
     """
+    if not html:
+        return parse_macro_indicators_from_tree(None)
+    
+    key = _macro_cache_key(html)
+    result = _macro_cache_get(key)
+    if result is None:
+        result = parse_macro_indicators_from_tree(parse_document(html))
+        _macro_cache_put(key, result)
+    return result
+
+
+def cached_macro_indicators(html: str) -> Optional[Dict[str, List[MacroIndicator]]]:
+    """Cached parse_macro_indicators result for html (re-stamped), or None on a miss."""
+    return _macro_cache_get(_macro_cache_key(html)) if html else None
+
+
+def cache_macro_indicators(html: str, result: Dict[str, List[MacroIndicator]]) -> None:
+    """Store a parse_macro_indicators result for html (e.g. one computed in a worker)."""
+    if html:
+        _macro_cache_put(_macro_cache_key(html), result)
+
+
+def _macro_cache_key(html: str) -> bytes:
+    """Cache key for a page: blake2b digest of its text."""
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _macro_cache_get(key: bytes) -> Optional[Dict[str, List[MacroIndicator]]]:
+    """Cached result for key, stamped with the current scrape timestamp."""
+    cached = _MACRO_CACHE.pop(key, None)
+    if cached is None:
+        return None
+    # Most recently used last
+    _MACRO_CACHE[key] = cached
+    stamp = {"timestamp": scrape_timestamp()}
+    return {
+        country: [indicator.model_copy(update=stamp) for indicator in indicators]
+        for country, indicators in cached.items()
+    }
+
+
+def _macro_cache_put(key: bytes, result: Dict[str, List[MacroIndicator]]) -> None:
+    """Cache result under key, evicting the least recently used entries."""
+    _MACRO_CACHE.pop(key, None)
+    _MACRO_CACHE[key] = {country: tuple(indicators) for country, indicators in result.items()}
+    while len(_MACRO_CACHE) > _MACRO_CACHE_SIZE:
+        _MACRO_CACHE.popitem(last=False)
+
+
+def clear_macro_cache() -> None:
+    """Drop all cached parse_macro_indicators results."""
+    _MACRO_CACHE.clear()
+
+
+def parse_macro_indicators_from_tree(tree: Optional[HtmlElement]) -> Dict[str, List[MacroIndicator]]:
+    """Same as parse_macro_indicators, for a page already parsed with lxml.html."""
     result: Dict[str, List[MacroIndicator]] = {
         "US": [],
         "UK": [],
@@ -311,78 +546,137 @@ def parse_macro_indicators(html: str) -> Dict[str, List[MacroIndicator]]:
         "IN": [],
     }
     
-    soup = BeautifulSoup(html, "lxml")
-    
-    # Try to find all country sections
-    countries_to_parse = [
-        ("United States", CountryCode.US),
-        ("United Kingdom", CountryCode.UK),
-        ("European Union", CountryCode.EU),
-        ("Euro Area", CountryCode.EU),
-        ("Japan", CountryCode.JP),
-        ("China", CountryCode.CN),
-        ("Germany", CountryCode.DE),
-        ("France", CountryCode.FR),
-        ("Italy", CountryCode.IT),
-        ("Spain", CountryCode.ES),
-        ("Canada", CountryCode.CA),
-        ("Australia", CountryCode.AU),
-        ("Brazil", CountryCode.BR),
-        ("India", CountryCode.IN),
-    ]
+    if tree is None:
+        return result
     
-    # Strategy 1: Find individual country tables
-    for country_name, country_code in countries_to_parse:
-        indicators = parse_country_macro(html, country_name, country_code)
+    # Strategy 1: Find individual country tables (page parsed and headers read once,
+    # every country's table located in a single sweep)
+    table_headers = _table_header_texts(tree)
+    tables = _find_macro_tables(tree, [name for name, _ in _MACRO_COUNTRIES], table_headers)
+    # Several countries can resolve to the same table; read each table's rows once
+    row_fields: Dict[HtmlElement, List[Dict[str, Any]]] = {}
+    for country_name, country_code in _MACRO_COUNTRIES:
+        table = tables[country_name]
+        if table is None:
+            continue
+        if table not in row_fields:
+            row_fields[table] = _indicator_row_fields(table)
+        indicators = _parse_indicator_rows(table, country_code, row_fields[table])
         if indicators:
             result[country_code.value] = indicators
     
     # Strategy 2: If no individual tables, try to parse single matrix table
     if all(len(v) == 0 for v in result.values()):
         # Look for matrix format: countries as rows, indicators as columns
-        tables = soup.find_all('table')
-        for table in tables:
+        for table, _ in table_headers:
             try:
-                rows = table.find_all('tr')
+                rows = _ROWS_XP(table)
                 if len(rows) < 2:
                     continue
                 
                 # First row might be header with indicator names
-                header_cells = rows[0].find_all(['td', 'th'])
-                indicator_names = [cell.get_text(strip=True) for cell in header_cells[1:]]
+                header_cells = _row_cells(rows[0])
+                indicator_names = [cell_text(cell) for cell in header_cells[1:]]
+                # Without indicator columns no row can yield a value
+                if not indicator_names:
+                    continue
                 
                 # Remaining rows are countries
                 for row in rows[1:]:
-                    cells = row.find_all(['td', 'th'])
+                    cells = _row_cells(row)
                     if len(cells) < 2:
                         continue
                     
-                    country_text = cells[0].get_text(strip=True)
+                    country_text = cell_text(cells[0])
                     # Match country text to code
-                    for name, code in countries_to_parse:
-                        if name.lower() in country_text.lower() or code.value.lower() in country_text.lower():
-                            code_str = code.value
-                            for i, cell in enumerate(cells[1:], start=0):
-                                if i < len(indicator_names):
-                                    value_str = cell.get_text(strip=True)
-                                    value = _parse_indicator_value(value_str)
-                                    
-                                    if value is not None:
-                                        indicator = MacroIndicator(
-                                            country=code,
-                                            indicator_name=indicator_names[i],
-                                            value=value,
-                                            unit="%",
-                                            frequency=_determine_frequency(indicator_names[i]),
-                                        )
-                                        result[code_str].append(indicator)
-                            break
+                    match = _MATRIX_COUNTRY_RE.search(country_text.lower())
+                    if match:
+                        code = _MATRIX_COUNTRY_LOOKUP[match.group(0)]
+                        code_str = code.value
+                        # Cells past the last indicator column are never read
+                        for indicator_name, cell in zip(indicator_names, cells[1:]):
+                            value_str = cell_text(cell)
+                            value = _parse_indicator_value(value_str)
+                            
+                            if value is not None:
+                                indicator = MacroIndicator.build_trusted(
+                                    country=code,
+                                    indicator_name=indicator_name,
+                                    value=value,
+                                    unit="%",
+                                    frequency=_determine_frequency(indicator_name),
+                                )
+                                result[code_str].append(indicator)
             except (ValueError, TypeError, AttributeError, IndexError):
                 continue
     
     return result
 
 
+def parse_macro_indicators_stream(source: Union[str, bytes, BinaryIO]) -> Dict[str, List[MacroIndicator]]:
+    """
+    Streaming variant of parse_macro_indicators for very large pages.
+    
+    Tables are read one at a time with lxml's iterparse and freed once
+    handled, so peak memory follows the largest table rather than the whole
+    document. Only tables whose headers name a country are recognised; pages
+    that need the text-search or matrix fallbacks should go through
+    parse_macro_indicators instead.
+    
+    Args:
+        source: HTML as str or bytes, or a binary file object
+        
+    Returns:
+        Dict mapping country code (str) to List[MacroIndicator]
+    """
+    result: Dict[str, List[MacroIndicator]] = {code.value: [] for code in CountryCode}
+    
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+        encoding = "utf-8"
+    else:
+        encoding = None
+    if isinstance(source, bytes):
+        if not source.strip():
+            return result
+        source = io.BytesIO(source)
+    
+    # First table whose headers mention each country, as _find_macro_table picks
+    found: Dict[str, List[MacroIndicator]] = {}
+    try:
+        for _, table in etree.iterparse(
+            source, events=("end",), tag="table", html=True,
+            remove_blank_text=True, encoding=encoding,
+        ):
+            # Nested tables stay in place until their outer table is done
+            if next(table.iterancestors("table"), None) is not None:
+                continue
+            
+            headers = [cell_text(header).lower() for header in table.iterdescendants("th")]
+            row_fields = None
+            for country_name, country_code in _MACRO_COUNTRIES:
+                country_lower = country_name.lower()
+                if country_name in found or not any(country_lower in header for header in headers):
+                    continue
+                if row_fields is None:
+                    row_fields = _indicator_row_fields(table)
+                found[country_name] = _parse_indicator_rows(table, country_code, row_fields)
+            
+            # Free the table and everything parsed before it
+            table.clear(keep_tail=True)
+            for node in (table, *table.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+    except etree.LxmlError:
+        pass
+    
+    for country_name, country_code in _MACRO_COUNTRIES:
+        if found.get(country_name):
+            result[country_code.value] = found[country_name]
+    
+    return result
+
+
 def parse_all_countries_separate(html: str) -> Dict[str, List[MacroIndicator]]:
     """
     Parse macro data when each country has its own section/table.
@@ -390,48 +684,44 @@ def parse_all_countries_separate(html: str) -> Dict[str, List[MacroIndicator]]:
     Useful for pages with collapsible country sections.
     """
     result: Dict[str, List[MacroIndicator]] = {}
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
+    if tree is None:
+        return result
     
     # Find all country sections
-    country_sections = soup.find_all(['div', 'section', 'article'], 
-                                       class_=lambda c: c and any(x in str(c).lower() 
-                                                                for x in ['country', 'nation', 'region']))
+    country_sections = _COUNTRY_SECTION_SEL(tree)
     
     for section in country_sections:
         try:
             # Extract country from section title
-            title_elem = section.find(['h2', 'h3', 'h4', '.title', '.header'])
-            if not title_elem:
+            title_elem = next(section.iterdescendants('h2', 'h3', 'h4'), None)
+            if title_elem is None:
                 continue
             
-            title = title_elem.get_text(strip=True)
+            title = cell_text(title_elem)
             
             # Match to country
-            matched_country = None
-            for name, code in COUNTRY_NAME_MAP.items():
-                if name in title.lower():
-                    matched_country = code
-                    break
+            match = _COUNTRY_RE.search(title.lower())
+            matched_country = COUNTRY_NAME_MAP[match.group(0)] if match else None
             
             if not matched_country:
                 continue
             
             # Parse indicators within this section
             indicators = []
-            rows = section.find_all('tr')
-            for row in rows:
+            for row in _ROWS_XP(section):
                 try:
-                    cells = row.find_all(['td', 'th'])
+                    cells = _row_cells(row)
                     if len(cells) >= 2:
-                        name = cells[0].get_text(strip=True)
-                        value_str = cells[1].get_text(strip=True)
+                        name = cell_text(cells[0])
+                        value_str = cell_text(cells[1])
                         
                         if name and value_str:
                             name = _clean_indicator_name(name)
                             value = _parse_indicator_value(value_str)
                             
                             if value is not None:
-                                indicator = MacroIndicator(
+                                indicator = MacroIndicator.build_trusted(
                                     country=matched_country,
                                     indicator_name=name,
                                     value=value,
@@ -450,44 +740,50 @@ def parse_all_countries_separate(html: str) -> Dict[str, List[MacroIndicator]]:
     return result
 
 
+# Name keywords for the headline indicators (any keyword selects the indicator)
+_HEADLINE_INDICATOR_KEYWORDS = {
+    "gdp": ("gdp",),
+    "inflation": ("inflation", "cpi"),
+    "unemployment": ("unemployment", "jobless"),
+}
+
+
 # Convenience functions for specific indicator parsing
-def parse_gdp_only(html: str) -> Dict[str, Optional[float]]:
-    """Extract only GDP growth rates for all countries."""
+def parse_headline_indicators(html: str) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Extract GDP, inflation and unemployment for all countries in one parse.
+    
+    Returns:
+        Dict mapping country code to {"gdp": ..., "inflation": ..., "unemployment": ...};
+        each value comes from the first matching indicator (None if absent)
+    """
     macro_data = parse_macro_indicators(html)
-    gdp_data = {}
+    headline_data = {}
     for country, indicators in macro_data.items():
+        values = dict.fromkeys(_HEADLINE_INDICATOR_KEYWORDS)
+        pending = dict(_HEADLINE_INDICATOR_KEYWORDS)
         for ind in indicators:
-            if 'gdp' in ind.indicator_name.lower():
-                gdp_data[country] = ind.value
+            name = ind.indicator_name.lower()
+            for key, keywords in list(pending.items()):
+                if any(word in name for word in keywords):
+                    values[key] = ind.value
+                    del pending[key]
+            if not pending:
                 break
-        else:
-            gdp_data[country] = None
-    return gdp_data
+        headline_data[country] = values
+    return headline_data
+
+
+def parse_gdp_only(html: str) -> Dict[str, Optional[float]]:
+    """Extract only GDP growth rates for all countries."""
+    return {country: values["gdp"] for country, values in parse_headline_indicators(html).items()}
 
 
 def parse_inflation_only(html: str) -> Dict[str, Optional[float]]:
     """Extract only inflation rates for all countries."""
-    macro_data = parse_macro_indicators(html)
-    inflation_data = {}
-    for country, indicators in macro_data.items():
-        for ind in indicators:
-            if 'inflation' in ind.indicator_name.lower() or 'cpi' in ind.indicator_name.lower():
-                inflation_data[country] = ind.value
-                break
-        else:
-            inflation_data[country] = None
-    return inflation_data
+    return {country: values["inflation"] for country, values in parse_headline_indicators(html).items()}
 
 
 def parse_unemployment_only(html: str) -> Dict[str, Optional[float]]:
     """Extract only unemployment rates for all countries."""
-    macro_data = parse_macro_indicators(html)
-    unemployment_data = {}
-    for country, indicators in macro_data.items():
-        for ind in indicators:
-            if 'unemployment' in ind.indicator_name.lower() or 'jobless' in ind.indicator_name.lower():
-                unemployment_data[country] = ind.value
-                break
-        else:
-            unemployment_data[country] = None
-    return unemployment_data
+    return {country: values["unemployment"] for country, values in parse_headline_indicators(html).items()}
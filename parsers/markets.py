@@ -1,16 +1,32 @@
 """
 Market Panels Parser
 
-Parses market data panels from HTML using BeautifulSoup4 with lxml.
+Parses market data panels from HTML using lxml.
 Functions for: Commodities, Stock Indexes, Major Stocks, Forex, Government Bonds, Crypto
+
+Every parser accepts the page as str (parsed into a full tree) or as raw
+bytes (e.g. response.content), which are streamed row by row with iterparse
+when the row selector can be checked from a <tr> and its ancestors alone.
 """
 
-from typing import List, Optional
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Union
+import io
+import cssselect
+from cssselect.parser import Attrib, Class, CombinedSelector, Element, Hash
+from lxml import etree
+from lxml.cssselect import CSSSelector, LxmlHTMLTranslator
+from lxml.html import HtmlElement
 
 from models import MarketInstrument, MarketCategory
-from config import SELECTORS
+from config import COMPILED_SELECTORS, SELECTORS
+from parsers._lxml import cell_text, parse_document
+
+# Cells of a table row or div-based row, compiled once (row.cssselect() re-translates per call)
+_ROW_CELLS = CSSSelector("td, th, .cell, .col", translator="html")
+
+# Same translator the compiled config selectors use
+_HTML_TRANSLATOR = LxmlHTMLTranslator()
 
 
 def _parse_percentage(value: str) -> Optional[float]:
@@ -41,40 +57,135 @@ def _parse_price(value: str) -> Optional[float]:
         return None
 
 
-def _find_instrument_rows(
-    soup: BeautifulSoup,
-    panel_selector: str,
-    row_selector: str = "tr, .row, .data-row"
-) -> List[Tag]:
-    """Find all instrument rows within a panel."""
-    panel = soup.select_one(panel_selector)
-    if not panel:
-        return []
-    return panel.select(row_selector)
+def _last_parsed(cells: List[str], parse) -> Optional[float]:
+    """Value of the last cell that parses (scans from the end and stops at the first hit)."""
+    for cell in reversed(cells):
+        value = parse(cell)
+        if value is not None:
+            return value
+    return None
+
+
+def _iter_instrument_rows(html: Union[str, bytes], rows_key: str) -> Iterator[HtmlElement]:
+    """Yield instrument rows using a compiled selector from config."""
+    if isinstance(html, bytes):
+        matcher = _row_matcher(rows_key)
+        if matcher is not None:
+            yield from _iter_instrument_rows_stream(html, matcher)
+            return
+    tree = parse_document(html)
+    if tree is None:
+        return
+    yield from COMPILED_SELECTORS[rows_key](tree)
+
+
+def _row_matcher(rows_key: str) -> Optional[Callable[[HtmlElement], bool]]:
+    """Streaming matcher for a config row selector (None: use the full tree)."""
+    return _compile_row_matcher(SELECTORS[rows_key])
+
+
+def _compound_element(compound) -> Optional[str]:
+    """
+    Element name of a compound selector built only from tag, #id, .class and [attr] parts.
+    
+    Returns None for anything else (pseudo-classes such as :nth-child depend
+    on siblings, which are dropped while streaming); "*" when no tag is given.
+    """
+    while isinstance(compound, (Class, Hash, Attrib)):
+        compound = compound.selector
+    if not isinstance(compound, Element):
+        return None
+    return compound.element or "*"
+
+
+@lru_cache(maxsize=None)
+def _compile_row_matcher(css: str) -> Optional[Callable[[HtmlElement], bool]]:
+    """
+    Per-<tr> test for a row selector, looking only at the row and its ancestors.
+    
+    Returns None unless every group ends in a tr compound and uses only
+    descendant/child combinators and tag, id, class or attribute parts.
+    """
+    groups = []
+    for group in cssselect.parse(css):
+        if group.pseudo_element is not None:
+            return None
+        steps, combinators = [], []
+        node = group.parsed_tree
+        while isinstance(node, CombinedSelector):
+            if node.combinator not in (" ", ">"):
+                return None
+            steps.append(node.subselector)
+            combinators.append(node.combinator)
+            node = node.selector
+        steps.append(node)
+        if any(_compound_element(step) is None for step in steps):
+            return None
+        # Only <tr> elements are streamed
+        if _compound_element(steps[0]) != "tr":
+            return None
+        # Right-most compound first, each paired with the combinator to its left
+        tests = [etree.XPath("self::" + str(_HTML_TRANSLATOR.xpath(step))) for step in steps]
+        groups.append((tests, combinators))
+    
+    def matches(element, tests, combinators, i=0) -> bool:
+        if not tests[i](element):
+            return False
+        if i == len(combinators):
+            return True
+        if combinators[i] == ">":
+            parent = element.getparent()
+            return parent is not None and matches(parent, tests, combinators, i + 1)
+        return any(matches(ancestor, tests, combinators, i + 1) for ancestor in element.iterancestors())
+    
+    return lambda row: any(matches(row, tests, combinators) for tests, combinators in groups)
+
+
+def _iter_instrument_rows_stream(html: bytes, matcher: Callable[[HtmlElement], bool]) -> Iterator[HtmlElement]:
+    """
+    Yield instrument rows from raw page bytes without keeping the whole DOM.
+    
+    Each <tr> is tested as soon as it is closed; afterwards it is cleared and
+    everything parsed before it is dropped, so the live tree holds little
+    more than the current row and its ancestors.
+    """
+    if not html or not html.strip():
+        return
+    try:
+        for _, row in etree.iterparse(
+            io.BytesIO(html), events=("end",), tag="tr", html=True, remove_blank_text=True,
+        ):
+            if matcher(row):
+                yield row
+            # Rows nested in another row stay until the outer row is done
+            if next(row.iterancestors("tr"), None) is not None:
+                continue
+            row.clear(keep_tail=True)
+            for node in (row, *row.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+    except etree.LxmlError:
+        return
 
 
-def _extract_row_cells(row: Tag) -> List[str]:
+def _extract_row_cells(row: HtmlElement) -> List[str]:
     """Extract text from table cells or div columns in a row."""
-    cells = row.select("td, th, .cell, .col")
+    cells = _ROW_CELLS(row)
     if cells:
-        return [cell.get_text(strip=True) for cell in cells]
+        return [cell_text(cell) for cell in cells]
     # Fallback: get all text from row
-    return [row.get_text(strip=True)]
+    return [cell_text(row)]
 
 
-def parse_commodities(html: str) -> List[MarketInstrument]:
+def parse_commodities(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse commodities panel (Gold, Silver, Oil, Natural Gas, etc.)
     
     Expected columns: Symbol/Name, Price, Change, % Change
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    panel_selector = SELECTORS.get("product_list", ".commodity-row, .commodity-item")
-    rows = _find_instrument_rows(soup, panel_selector)
     
-    for row in rows:
+    for row in _iter_instrument_rows(html, "commodities_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 2:
@@ -93,19 +204,12 @@ def parse_commodities(html: str) -> List[MarketInstrument]:
                 if price is not None:
                     break
             
-            # Parse change (usually 4th or 3rd column)
+            # Parse change (usually 4th or 3rd column); pct_change is in the last two
             change = None
-            pct_change = None
-            for i, cell in enumerate(cells):
-                pct = _parse_percentage(cell)
-                if pct is not None:
-                    if i == len(cells) - 2:
-                        pct_change = pct
-                    elif i == len(cells) - 1:
-                        pct_change = pct
+            pct_change = _last_parsed(cells[-2:], _parse_percentage)
             
             if price is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=symbol,
                     name=name_cell,
                     value=price,
@@ -119,19 +223,15 @@ def parse_commodities(html: str) -> List[MarketInstrument]:
     return instruments
 
 
-def parse_indexes(html: str) -> List[MarketInstrument]:
+def parse_indexes(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse stock indexes panel (S&P 500, Dow Jones, NASDAQ, etc.)
     
     Expected columns: Index Name, Value, Change, % Change
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
     
-    panel_selector = SELECTORS.get("product_list", ".index-row, .index-item, .indices-item")
-    rows = _find_instrument_rows(soup, panel_selector)
-    
-    for row in rows:
+    for row in _iter_instrument_rows(html, "indices_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 2:
@@ -156,7 +256,7 @@ def parse_indexes(html: str) -> List[MarketInstrument]:
                     break
             
             if value is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=symbol,
                     name=name_cell,
                     value=value,
@@ -169,19 +269,15 @@ def parse_indexes(html: str) -> List[MarketInstrument]:
     return instruments
 
 
-def parse_stocks(html: str) -> List[MarketInstrument]:
+def parse_stocks(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse major stocks panel (Apple, Microsoft, Google, etc.)
     
     Expected columns: Symbol, Company Name, Price, Change, % Change
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    panel_selector = SELECTORS.get("product_list", ".stock-row, .stock-item, .equity-item")
-    rows = _find_instrument_rows(soup, panel_selector)
     
-    for row in rows:
+    for row in _iter_instrument_rows(html, "stocks_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 3:
@@ -198,19 +294,12 @@ def parse_stocks(html: str) -> List[MarketInstrument]:
                 if price is not None:
                     break
             
-            # Parse change and pct_change
-            change = None
-            pct_change = None
-            for i, cell in enumerate(cells[3:], start=3):
-                val = _parse_price(cell)
-                pct = _parse_percentage(cell)
-                if val is not None and i >= 3:
-                    change = val
-                if pct is not None:
-                    pct_change = pct
+            # Parse change and pct_change (the last parseable cell from col 3 on wins)
+            change = _last_parsed(cells[3:], _parse_price)
+            pct_change = _last_parsed(cells[3:], _parse_percentage)
             
             if price is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=symbol,
                     name=name,
                     value=price,
@@ -224,19 +313,15 @@ def parse_stocks(html: str) -> List[MarketInstrument]:
     return instruments
 
 
-def parse_forex(html: str) -> List[MarketInstrument]:
+def parse_forex(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse forex panel (EUR/USD, GBP/USD, USD/JPY, etc.)
     
     Expected columns: Pair, Price, Change, % Change
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    panel_selector = SELECTORS.get("product_list", ".forex-row, .fx-row, .currency-item")
-    rows = _find_instrument_rows(soup, panel_selector)
     
-    for row in rows:
+    for row in _iter_instrument_rows(html, "forex_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 2:
@@ -247,21 +332,20 @@ def parse_forex(html: str) -> List[MarketInstrument]:
             
             # Parse price (typically 4 decimal places for major pairs)
             price = None
-            for cell in cells[1:3]:
+            price_idx = 0
+            for price_idx, cell in enumerate(cells[1:3], start=1):
                 price = _parse_price(cell)
                 if price is not None:
                     break
             
-            # Parse change (small values, typically)
+            # Parse change (small values, typically in the column after price)
             change = None
-            pct_change = None
-            for cell in cells:
-                pct = _parse_percentage(cell)
-                if pct is not None:
-                    pct_change = pct
+            if price is not None and price_idx + 1 < len(cells) and '%' not in cells[price_idx + 1]:
+                change = _parse_price(cells[price_idx + 1])
+            pct_change = _last_parsed(cells, _parse_percentage)
             
             if price is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=pair,
                     name=cells[0],
                     value=price,
@@ -275,19 +359,15 @@ def parse_forex(html: str) -> List[MarketInstrument]:
     return instruments
 
 
-def parse_bonds(html: str) -> List[MarketInstrument]:
+def parse_bonds(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse government bonds panel (US 10Y, UK Gilts, German Bund, etc.)
     
     Expected columns: Bond, Yield, Change, % Change
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
     
-    panel_selector = SELECTORS.get("product_list", ".bond-row, .bonds-item, .yield-row")
-    rows = _find_instrument_rows(soup, panel_selector)
-    
-    for row in rows:
+    for row in _iter_instrument_rows(html, "bonds_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 2:
@@ -306,14 +386,10 @@ def parse_bonds(html: str) -> List[MarketInstrument]:
             
             # Parse change
             change = None
-            pct_change = None
-            for cell in cells:
-                pct = _parse_percentage(cell)
-                if pct is not None:
-                    pct_change = pct
+            pct_change = _last_parsed(cells, _parse_percentage)
             
             if yield_val is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=symbol,
                     name=name_cell,
                     value=yield_val,
@@ -327,19 +403,16 @@ def parse_bonds(html: str) -> List[MarketInstrument]:
     return instruments
 
 
-def parse_crypto(html: str) -> List[MarketInstrument]:
+def parse_crypto(html: Union[str, bytes]) -> List[MarketInstrument]:
     """
     Parse cryptocurrency panel (Bitcoin, Ethereum, Solana, etc.)
     
-    Expected columns: Coin, Price, 24h Change, Market Cap
+    Expected columns: Symbol, Name, Price, 24h Change, % Change
+    (or Coin, Price, ... without a separate Name column)
     """
     instruments = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    panel_selector = SELECTORS.get("product_list", ".crypto-row, .crypto-item, .coin-row")
-    rows = _find_instrument_rows(soup, panel_selector)
     
-    for row in rows:
+    for row in _iter_instrument_rows(html, "crypto_rows"):
         try:
             cells = _extract_row_cells(row)
             if len(cells) < 2:
@@ -351,23 +424,25 @@ def parse_crypto(html: str) -> List[MarketInstrument]:
             
             # Parse price (may be large numbers for BTC)
             price = None
-            for cell in cells[1:3]:
+            price_idx = 0
+            for price_idx, cell in enumerate(cells[1:3], start=1):
                 price = _parse_price(cell)
                 if price is not None:
                     break
             
+            # A Name column sits between symbol and price; placeholders like "—" are not names
+            name = name_cell
+            if price is not None and price_idx == 2 and any(ch.isalpha() for ch in cells[1]):
+                name = cells[1]
+            
             # Parse 24h change
             change = None
-            pct_change = None
-            for cell in cells:
-                pct = _parse_percentage(cell)
-                if pct is not None:
-                    pct_change = pct
+            pct_change = _last_parsed(cells, _parse_percentage)
             
             if price is not None:
-                instruments.append(MarketInstrument(
+                instruments.append(MarketInstrument.build_trusted(
                     symbol=symbol,
-                    name=name_cell,
+                    name=name,
                     value=price,
                     change=change,
                     pct_change=pct_change,
@@ -3,15 +3,22 @@ HTTP Scraper Core with Robots.txt Compliance
 
 Exports:
     scrape_page(url: str) -> str: Scrape a page and return HTML content
+    get_shared_client() -> ScrapingClient: The event loop's pooled client
     orchestrate(): Complete scraping pipeline
 """
 
 import asyncio
+import os
+import random
+import re
 import time
+import weakref
 import httpx
 import logging
 from urllib.parse import urlparse, urljoin
-from typing import Optional, Set, Dict, Any
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import Optional, Set, Dict, DefaultDict, Any, Callable, Mapping, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -19,10 +26,14 @@ logger = logging.getLogger(__name__)
 
 from config import (
     HEADERS,
+    HEADER_CYCLE,
     USER_AGENTS,
     RETRY_CONFIG,
     RATE_LIMIT_DELAY,
     HTTP_TIMEOUT,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
     SELECTORS,
 )
 
@@ -66,78 +77,102 @@ class RobotsTxt:
 
 class RobotsCache:
     """Cache for robots.txt files per host."""
-    _cache: Dict[str, RobotsTxt] = {}
     
-    @classmethod
-    def get(cls, host: str) -> Optional[RobotsTxt]:
+    def __init__(self):
+        self._cache: Dict[str, RobotsTxt] = {}
+        # Held while a host's robots.txt is fetched, so concurrent callers wait for it
+        self.host_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+    
+    def get(self, host: str) -> Optional[RobotsTxt]:
         """Get cached robots.txt or None if expired."""
-        robots = cls._cache.get(host)
+        robots = self._cache.get(host)
         if robots and (datetime.now() - robots.last_checked) < robots.cache_ttl:
             return robots
         return None
     
-    @classmethod
-    def set(cls, host: str, robots: RobotsTxt) -> None:
+    def set(self, host: str, robots: RobotsTxt) -> None:
         """Cache robots.txt for a host."""
-        cls._cache[host] = robots
+        self._cache[host] = robots
+
+
+# Used by callers that don't bring their own cache; one per event loop,
+# since asyncio.Lock binds to the loop that first waits on it
+_default_robots_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RobotsCache]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
-async def parse_robots_txt(client: httpx.Client, url: str) -> RobotsTxt:
+async def parse_robots_txt(
+    client: httpx.AsyncClient,
+    url: str,
+    cache: Optional[RobotsCache] = None,
+) -> RobotsTxt:
     """Fetch and parse robots.txt for a URL's host."""
+    if cache is None:
+        loop = asyncio.get_running_loop()
+        cache = _default_robots_caches.get(loop)
+        if cache is None:
+            cache = _default_robots_caches[loop] = RobotsCache()
     parsed = urlparse(url)
     host = parsed.netloc
     
     # Check cache first
-    cached = RobotsCache.get(host)
+    cached = cache.get(host)
     if cached:
         return cached
     
-    robots_url = f"{parsed.scheme}://{host}/robots.txt"
-    
-    try:
-        response = await client.get(robots_url, timeout=HTTP_TIMEOUT)
-        if response.status_code == 404:
-            # No robots.txt = allowed for all
-            robots = RobotsTxt()
-        elif response.status_code != 200:
-            # If we can't fetch robots.txt, be permissive but log warning
+    async with cache.host_locks[host]:
+        # Another caller may have fetched it while we waited
+        cached = cache.get(host)
+        if cached:
+            return cached
+        
+        robots_url = f"{parsed.scheme}://{host}/robots.txt"
+        
+        try:
+            response = await client.get(robots_url, timeout=HTTP_TIMEOUT)
+            if response.status_code == 404:
+                # No robots.txt = allowed for all
+                robots = RobotsTxt()
+            elif response.status_code != 200:
+                # If we can't fetch robots.txt, be permissive but log warning
+                robots = RobotsTxt()
+            else:
+                robots = _parse_robots_content(response.content)
+        except httpx.RequestError:
+            # Network error - proceed with empty robots (permissive)
             robots = RobotsTxt()
-        else:
-            robots = _parse_robots_content(response.text)
-    except httpx.RequestError:
-        # Network error - proceed with empty robots (permissive)
-        robots = RobotsTxt()
-    
-    RobotsCache.set(host, robots)
+        
+        cache.set(host, robots)
     return robots
 
 
-def _parse_robots_content(content: str) -> RobotsTxt:
-    """Parse robots.txt content and extract rules."""
+# One robots.txt rule per match: (field, value); comment lines never match
+_ROBOTS_RE = re.compile(
+    rb'^[ \t]*(user-agent|disallow|allow|crawl-delay)[ \t]*:[ \t]*(.*?)[ \t\r]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _parse_robots_content(content: bytes) -> RobotsTxt:
+    """Parse raw robots.txt bytes and extract rules."""
     allowed = set()
     disallowed = set()
     crawl_delay = None
-    in_user_agent_block = False
     
-    for line in content.splitlines():
-        line = line.strip().lower()
-        if not line or line.startswith('#'):
+    for match in _ROBOTS_RE.finditer(content):
+        rule, value = match.groups()
+        if not value:
             continue
-        
-        if line.startswith('user-agent:'):
-            in_user_agent_block = True
-            # Reset for new UA block - we track all rules
-        elif line.startswith('disallow:'):
-            path = line.split(':', 1)[1].strip()
-            if path:
-                disallowed.add(path)
-        elif line.startswith('allow:'):
-            path = line.split(':', 1)[1].strip()
-            if path:
-                allowed.add(path)
-        elif line.startswith('crawl-delay:'):
+        rule = rule.lower()
+        # User-agent lines only open a new block - we track all rules
+        if rule == b'disallow':
+            disallowed.add(value.decode('utf-8', 'replace').lower())
+        elif rule == b'allow':
+            allowed.add(value.decode('utf-8', 'replace').lower())
+        elif rule == b'crawl-delay':
             try:
-                crawl_delay = float(line.split(':', 1)[1].strip())
+                crawl_delay = float(value)
             except ValueError:
                 pass
     
@@ -150,35 +185,36 @@ def _parse_robots_content(content: str) -> RobotsTxt:
 
 def get_random_user_agent() -> str:
     """Get a random User-Agent from the configured list."""
-    import random
     return random.choice(USER_AGENTS)
 
 
-def build_request_headers() -> Dict[str, str]:
-    """Build request headers with random User-Agent."""
-    headers = HEADERS.copy()
-    headers["User-Agent"] = get_random_user_agent()
-    return headers
+def build_request_headers() -> Mapping[str, str]:
+    """Return the next precomputed, read-only header set (rotating User-Agent)."""
+    return next(HEADER_CYCLE)
 
 
 class RateLimiter:
     """Simple rate limiter with per-host tracking."""
-    _last_request: Dict[str, float] = {}
     
-    @classmethod
-    async def wait(cls, url: str) -> None:
+    def __init__(self):
+        self._last_request: Dict[str, float] = {}
+        # Concurrent callers for one host take turns through the check-sleep-stamp
+        self._host_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+    
+    async def wait(self, url: str) -> None:
         """Wait if necessary to respect rate limits."""
         parsed = urlparse(url)
         host = parsed.netloc
         
-        now = time.time()
-        last_time = cls._last_request.get(host, 0)
-        elapsed = now - last_time
-        
-        if elapsed < RATE_LIMIT_DELAY:
-            await asyncio.sleep(RATE_LIMIT_DELAY - elapsed)
-        
-        cls._last_request[host] = time.time()
+        async with self._host_locks[host]:
+            now = time.time()
+            last_time = self._last_request.get(host, 0)
+            elapsed = now - last_time
+            
+            if elapsed < RATE_LIMIT_DELAY:
+                await asyncio.sleep(RATE_LIMIT_DELAY - elapsed)
+            
+            self._last_request[host] = time.time()
 
 
 class ScrapingClient:
@@ -186,11 +222,22 @@ class ScrapingClient:
     
     def __init__(self):
         self._client: Optional[httpx.AsyncClient] = None
-        self._transport = httpx.AsyncHTTPTransport()
+        self._robots_cache = RobotsCache()
+        self._rate_limiter = RateLimiter()
     
     async def __aenter__(self):
+        # One pooled HTTP/2 connection set is reused for every scrape() call
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
         self._client = httpx.AsyncClient(
-            transport=self._transport,
+            transport=transport,
+            headers=HEADERS,
             timeout=HTTP_TIMEOUT,
             follow_redirects=True,
         )
@@ -202,7 +249,7 @@ class ScrapingClient:
     
     async def _check_robots_txt(self, url: str) -> None:
         """Verify the URL is allowed by robots.txt."""
-        robots = await parse_robots_txt(self._client, url)
+        robots = await parse_robots_txt(self._client, url, self._robots_cache)
         parsed = urlparse(url)
         path = parsed.path or "/"
         
@@ -212,34 +259,29 @@ class ScrapingClient:
     async def _request_with_retry(
         self,
         url: str,
-        headers: Dict[str, str],
-        attempt: int = 0,
+        headers: Mapping[str, str],
     ) -> httpx.Response:
-        """Make a request with retry logic."""
-        try:
-            response = await self._client.get(url, headers=headers)
-            response.raise_for_status()
-            return response
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
+        """Make a request, retrying 5xx responses and network errors with jittered backoff."""
+        max_retries = RETRY_CONFIG["max_retries"]
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._client.get(url, headers=headers)
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                # Only 5xx errors are worth retrying
+                if not 500 <= status_code < 600:
+                    raise RequestError(f"HTTP {status_code}: {url}")
+                if attempt == max_retries:
+                    raise RequestError(f"Failed after {max_retries} retries: {url}")
+            except httpx.RequestError as e:
+                if attempt == max_retries:
+                    raise RequestError(f"Request failed after {max_retries} retries: {e}")
             
-            # Retry on 5xx errors
-            if 500 <= status_code < 600:
-                if attempt < RETRY_CONFIG["max_retries"]:
-                    backoff = RETRY_CONFIG["backoff_factor"] * (2 ** attempt)
-                    await asyncio.sleep(backoff)
-                    return await self._request_with_retry(url, headers, attempt + 1)
-                else:
-                    raise RequestError(f"Failed after {RETRY_CONFIG['max_retries']} retries: {url}")
-            else:
-                raise RequestError(f"HTTP {status_code}: {url}")
-        except httpx.RequestError as e:
-            if attempt < RETRY_CONFIG["max_retries"]:
-                backoff = RETRY_CONFIG["backoff_factor"] * (2 ** attempt)
-                await asyncio.sleep(backoff)
-                return await self._request_with_retry(url, headers, attempt + 1)
-            else:
-                raise RequestError(f"Request failed after {RETRY_CONFIG['max_retries']} retries: {e}")
+            # Jitter spreads retries from concurrent callers apart
+            backoff = RETRY_CONFIG["backoff_factor"] * (2 ** attempt) * (0.5 + random.random())
+            await asyncio.sleep(backoff)
     
     async def scrape(self, url: str) -> str:
         """Scrape a URL and return HTML content."""
@@ -250,7 +292,7 @@ class ScrapingClient:
         await self._check_robots_txt(url)
         
         # Apply rate limiting
-        await RateLimiter.wait(url)
+        await self._rate_limiter.wait(url)
         
         # Build headers with rotating UA
         headers = build_request_headers()
@@ -261,10 +303,36 @@ class ScrapingClient:
         return response.text
 
 
+# One open ScrapingClient per event loop; dropped along with its loop
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ScrapingClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_shared_client() -> ScrapingClient:
+    """Return the running loop's shared ScrapingClient, opening it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None:
+        client = await ScrapingClient().__aenter__()
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the running loop's shared ScrapingClient, if one was opened."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.__aexit__(None, None, None)
+
+
 async def scrape_page(url: str) -> str:
     """
     Scrape a web page and return its HTML content.
     
+    Calls on the same event loop share one pooled client (see
+    get_shared_client); call close_shared_client() before the loop ends.
+    
     Args:
         url: The URL to scrape
         
@@ -275,14 +343,20 @@ async def scrape_page(url: str) -> str:
         ScraperError: If scraping fails after retries
         RobotsTxtError: If URL is blocked by robots.txt
     """
-    async with ScrapingClient() as client:
-        return await client.scrape(url)
+    client = await get_shared_client()
+    return await client.scrape(url)
 
 
 # Synchronous wrapper for convenience
 def scrape_page_sync(url: str) -> str:
     """Synchronous wrapper for scrape_page."""
-    return asyncio.run(scrape_page(url))
+    async def _scrape() -> str:
+        try:
+            return await scrape_page(url)
+        finally:
+            await close_shared_client()
+    
+    return asyncio.run(_scrape())
 
 
 # ============================================================================
@@ -312,7 +386,11 @@ async def orchestrate(
     if verbose:
         logging.basicConfig(level=logging.DEBUG)
     
+    from concurrent.futures import ProcessPoolExecutor
+    from models import set_scrape_timestamp
+    
     start_time = datetime.utcnow()
+    set_scrape_timestamp(start_time)
     logger.info("Starting orchestration...")
     
     errors = []
@@ -331,6 +409,14 @@ async def orchestrate(
         },
     }
     
+    # Parsers run in worker processes so pages parse on separate cores;
+    # workers get the batch timestamp via the initializer
+    pool = ProcessPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1),
+        initializer=set_scrape_timestamp,
+        initargs=(start_time,),
+    )
+    
     try:
         async with ScrapingClient() as client:
             # Import parsers here to avoid circular imports
@@ -342,71 +428,42 @@ async def orchestrate(
                 parse_bonds,
                 parse_crypto,
             )
-            from parsers.macro import parse_macro_indicators
+            from parsers.macro import (
+                parse_macro_indicators,
+                cached_macro_indicators,
+                cache_macro_indicators,
+            )
             from parsers.headlines import parse_all_news_categories
             
-            # Fetch and parse markets
-            logger.info("Fetching market data...")
-            
-            try:
-                html = await client.scrape("https://tradingeconomics.com/forex")
-                data["forex"] = parse_forex(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch forex: {e}")
-                errors.append(f"forex: {str(e)}")
-            
-            try:
-                html = await client.scrape("https://tradingeconomics.com/indices")
-                data["indices"] = parse_indexes(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch indices: {e}")
-                errors.append(f"indices: {str(e)}")
-            
-            try:
-                html = await client.scrape("https://tradingeconomics.com/commodities")
-                data["commodities"] = parse_commodities(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch commodities: {e}")
-                errors.append(f"commodities: {str(e)}")
-            
-            try:
-                html = await client.scrape("https://tradingeconomics.com/bonds")
-                data["bonds"] = parse_bonds(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch bonds: {e}")
-                errors.append(f"bonds: {str(e)}")
+            sources = [
+                ("forex", "https://tradingeconomics.com/forex", parse_forex),
+                ("indices", "https://tradingeconomics.com/indices", parse_indexes),
+                ("commodities", "https://tradingeconomics.com/commodities", parse_commodities),
+                ("bonds", "https://tradingeconomics.com/bonds", parse_bonds),
+                ("crypto", "https://tradingeconomics.com/crypto", parse_crypto),
+                ("stocks", "https://tradingeconomics.com/stocks", parse_stocks),
+                ("macro", "https://tradingeconomics.com/macro", parse_macro_indicators),
+                ("news", "https://tradingeconomics.com/news", parse_all_news_categories),
+            ]
+            # Page caches checked here: the pool's workers don't outlive this call
+            caches = {"macro": (cached_macro_indicators, cache_macro_indicators)}
             
-            try:
-                html = await client.scrape("https://tradingeconomics.com/crypto")
-                data["crypto"] = parse_crypto(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch crypto: {e}")
-                errors.append(f"crypto: {str(e)}")
-            
-            try:
-                html = await client.scrape("https://tradingeconomics.com/stocks")
-                data["stocks"] = parse_stocks(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch stocks: {e}")
-                errors.append(f"stocks: {str(e)}")
-            
-            # Fetch macro
-            logger.info("Fetching macro data...")
-            try:
-                html = await client.scrape("https://tradingeconomics.com/macro")
-                data["macro"] = parse_macro_indicators(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch macro: {e}")
-                errors.append(f"macro: {str(e)}")
+            # Fetch all pages concurrently; the client's rate limiter still spaces requests per host
+            logger.info("Fetching market, macro and news data...")
+            results = await asyncio.gather(
+                *[
+                    _fetch_and_parse(client, url, parse, pool, caches.get(name))
+                    for name, url, parse in sources
+                ],
+                return_exceptions=True,
+            )
             
-            # Fetch news
-            logger.info("Fetching news...")
-            try:
-                html = await client.scrape("https://tradingeconomics.com/news")
-                data["news"] = parse_all_news_categories(html)
-            except Exception as e:
-                logger.warning(f"Could not fetch news: {e}")
-                errors.append(f"news: {str(e)}")
+            for (name, _, _), result in zip(sources, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Could not fetch {name}: {result}")
+                    errors.append(f"{name}: {str(result)}")
+                else:
+                    data[name] = result
             
             # Update metadata
             duration = (datetime.utcnow() - start_time).total_seconds()
@@ -417,6 +474,9 @@ async def orchestrate(
         logger.error(f"Orchestration failed: {e}")
         errors.append(str(e))
         data["metadata"]["errors"] = errors
+    finally:
+        pool.shutdown(cancel_futures=True)
+        set_scrape_timestamp(None)
     
     logger.info(f"Orchestration complete in {data['metadata'].get('duration_seconds', 0):.2f}s")
     
@@ -429,6 +489,33 @@ async def orchestrate(
     return data
 
 
+async def _fetch_and_parse(
+    client: ScrapingClient,
+    url: str,
+    parse: Callable[[str], Any],
+    executor: Optional[Executor] = None,
+    cache: Optional[Tuple[Callable[[str], Any], Callable[[str, Any], None]]] = None,
+) -> Any:
+    """
+    Scrape a URL and run its parser in the executor (default thread pool if None).
+    
+    cache is an optional (lookup, store) pair consulted in this process, so
+    results survive executors whose workers are torn down after each run.
+    """
+    html = await client.scrape(url)
+    if cache is not None:
+        lookup, store = cache
+        result = lookup(html)
+        if result is not None:
+            return result
+    # Parsing is CPU-bound; keep it off the event loop while other fetches run
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(executor, parse, html)
+    if cache is not None:
+        store(html, result)
+    return result
+
+
 def orchestrate_sync(output_path: Optional[str] = None, verbose: bool = False) -> dict:
     """Synchronous wrapper for orchestrate."""
     return asyncio.run(orchestrate(output_path, verbose))
@@ -56,12 +56,96 @@ class TestForexParser:
             assert eurusd.change == 0.0025
             assert eurusd.pct_change == 0.23
     
+    def test_parse_forex_change_column(self, homepage_html):
+        """Test that change is read from the cell right after the price."""
+        from parsers.markets import parse_forex
+        
+        changes = {i.symbol: i.change for i in parse_forex(homepage_html)}
+        assert changes["EURUSD"] == 0.0025
+        assert changes["GBPUSD"] == -0.0010
+        assert changes["USDJPY"] == 0.45
+    
+    def test_parse_forex_change_skips_percentage_cell(self):
+        """Test that a percentage right after the price is not read as the change."""
+        from parsers.markets import parse_forex
+        
+        html = (
+            '<html><body><div id="fx"><table><tbody>'
+            '<tr><td>EUR/USD</td><td>1.0850</td><td>0.23%</td></tr>'
+            '</tbody></table></div></body></html>'
+        )
+        result = parse_forex(html)
+        assert len(result) == 1
+        assert result[0].change is None
+        assert result[0].pct_change == 0.23
+    
     def test_parse_forex_handles_empty_html(self, empty_html):
         """Test that forex parser handles empty HTML gracefully."""
         from parsers.markets import parse_forex
         
         result = parse_forex(empty_html)
         assert result == []
+    
+    @pytest.mark.parametrize("parser_name", [
+        "parse_forex", "parse_indexes", "parse_commodities",
+        "parse_bonds", "parse_crypto", "parse_stocks",
+    ])
+    def test_market_parsers_accept_bytes(self, homepage_html, parser_name):
+        """Test that raw page bytes stream to the same instruments as text for every *_rows key."""
+        from parsers import markets
+        
+        parse = getattr(markets, parser_name)
+        from_text = parse(homepage_html)
+        from_bytes = parse(homepage_html.encode("utf-8"))
+        assert from_text
+        assert [i.model_dump(exclude={"timestamp"}) for i in from_bytes] == [
+            i.model_dump(exclude={"timestamp"}) for i in from_text
+        ]
+        assert parse(b"") == []
+    
+    @pytest.mark.parametrize("css, expected", [
+        ("#fx tbody tr:nth-child(2)", ["GBPUSD"]),
+        ("#x .row", ["AAA"]),
+    ])
+    def test_parse_forex_bytes_falls_back_to_tree(self, monkeypatch, css, expected):
+        """Test that selectors a streamed <tr> can't answer fall back to the full tree."""
+        from lxml.cssselect import CSSSelector
+        from parsers import markets
+        
+        html = (
+            '<html><body><div id="fx"><table><tbody>'
+            '<tr><td>EUR/USD</td><td>1.0850</td><td>0.0025</td><td>0.23%</td></tr>'
+            '<tr><td>GBP/USD</td><td>1.2700</td><td>0.0010</td><td>0.08%</td></tr>'
+            '<tr><td>USD/JPY</td><td>148.50</td><td>0.20</td><td>0.13%</td></tr>'
+            '</tbody></table></div>'
+            '<div id="x"><div class="row"><span class="cell">AAA</span>'
+            '<span class="cell">1.50</span><span class="cell">0.10%</span></div></div>'
+            '</body></html>'
+        )
+        monkeypatch.setattr(markets, "SELECTORS", {"forex_rows": css})
+        monkeypatch.setattr(
+            markets, "COMPILED_SELECTORS", {"forex_rows": CSSSelector(css, translator="html")}
+        )
+        
+        assert markets._row_matcher("forex_rows") is None
+        from_text = [i.symbol for i in markets.parse_forex(html)]
+        from_bytes = [i.symbol for i in markets.parse_forex(html.encode("utf-8"))]
+        assert from_text == expected
+        assert from_bytes == from_text
+    
+    def test_parse_forex_ignores_script_text(self):
+        """Test that script content inside a cell is not read as cell text."""
+        from parsers.markets import parse_forex
+        
+        html = (
+            '<html><body><div id="fx"><table><tbody><tr>'
+            '<td>EUR/USD</td><td>1.0850</td><td>0.0025</td>'
+            '<td>0.23<script>var x=9</script>%</td>'
+            '</tr></tbody></table></div></body></html>'
+        )
+        result = parse_forex(html)
+        assert len(result) == 1
+        assert result[0].pct_change == 0.23
 
 
 class TestIndicesParser:
@@ -211,6 +295,29 @@ class TestCryptoParser:
             assert btc.value > 0
             assert "USD" in btc.name
 
+    
+    def test_parse_crypto_name_column(self, homepage_html):
+        """Test that the Name column is used as the name when the row has one."""
+        from parsers.markets import parse_crypto
+        
+        btc = next(i for i in parse_crypto(homepage_html) if i.symbol == "BTC")
+        assert btc.name == "Bitcoin/USD"
+        assert btc.value == 52345.0
+    
+    @pytest.mark.parametrize("cells, name", [
+        (["BTC", "52,345.00", "2.45%"], "BTC"),
+        (["BTC", "—", "52,345.00", "2.45%"], "BTC"),
+    ])
+    def test_parse_crypto_name_without_name_column(self, cells, name):
+        """Test that price or placeholder cells are never taken as the name."""
+        from parsers.markets import parse_crypto
+        
+        row = "".join(f"<td>{cell}</td>" for cell in cells)
+        html = f'<html><body><div id="crypto"><table><tbody><tr>{row}</tr></tbody></table></div></body></html>'
+        result = parse_crypto(html)
+        assert len(result) == 1
+        assert result[0].name == name
+        assert result[0].value == 52345.0
 
 class TestStocksParser:
     """Tests for stocks parser."""
@@ -307,6 +414,71 @@ class TestMacroParser:
         assert isinstance(result, dict)
         # May return empty dict or dict with empty lists
     
+    def test_parse_macro_indicators_cached(self, homepage_html):
+        """Test that repeated parses of the same page return equal, independent results."""
+        from parsers.macro import parse_macro_indicators, clear_macro_cache
+        
+        clear_macro_cache()
+        first = parse_macro_indicators(homepage_html)
+        second = parse_macro_indicators(homepage_html)
+        
+        def summary(result):
+            return {
+                country: [(i.indicator_name, i.value) for i in indicators]
+                for country, indicators in result.items()
+            }
+        
+        assert summary(second) == summary(first)
+        
+        # Mutating a returned list must not leak into the cache
+        second["US"].clear()
+        assert summary(parse_macro_indicators(homepage_html)) == summary(first)
+    
+    def test_macro_cache_filled_from_worker_result(self, homepage_html):
+        """Test that a result stored by the parent is served on the next lookup."""
+        from parsers.macro import (
+            parse_macro_indicators,
+            cached_macro_indicators,
+            cache_macro_indicators,
+            clear_macro_cache,
+        )
+        
+        clear_macro_cache()
+        assert cached_macro_indicators(homepage_html) is None
+        
+        result = parse_macro_indicators(homepage_html)
+        clear_macro_cache()
+        cache_macro_indicators(homepage_html, result)
+        
+        hit = cached_macro_indicators(homepage_html)
+        assert hit is not None
+        assert {c: len(v) for c, v in hit.items()} == {c: len(v) for c, v in result.items()}
+    
+    def test_parse_macro_indicators_stream_matches_tree(self):
+        """Test that the streaming parser agrees with the tree parser on country tables."""
+        from parsers.macro import parse_macro_indicators, parse_macro_indicators_stream
+        
+        html = """
+        <html><body>
+        <table><tr><th>United States</th><th>Value</th></tr>
+            <tr><td>GDP Growth Rate</td><td>2.4%</td></tr>
+            <tr><td>Inflation YoY</td><td>3.1 (3.4)</td></tr></table>
+        <div><table><tr><th>Japan</th><th>Value</th></tr>
+            <tr><td>Jobless Rate</td><td>2.5%</td></tr></table></div>
+        </body></html>
+        """
+        
+        def summary(result):
+            return {
+                country: [(i.indicator_name, i.value, i.previous, i.unit) for i in indicators]
+                for country, indicators in result.items()
+            }
+        
+        streamed = parse_macro_indicators_stream(html)
+        assert summary(streamed) == summary(parse_macro_indicators(html))
+        assert "Unemployment Rate" in [i.indicator_name for i in streamed["JP"]]
+        assert parse_macro_indicators_stream(html.encode("utf-8")).keys() == streamed.keys()
+    
     def test_parse_gdp_only(self, homepage_html):
         """Test parse_gdp_only function."""
         from parsers.macro import parse_gdp_only
@@ -327,6 +499,32 @@ class TestMacroParser:
         
         result = parse_unemployment_only(homepage_html)
         assert isinstance(result, dict)
+    
+    def test_determine_frequency(self):
+        """Test frequency detection keywords and their precedence."""
+        from parsers.macro import _determine_frequency
+        
+        assert _determine_frequency("GDP Growth Rate") == "quarterly"
+        assert _determine_frequency("Annual GDP Growth") == "quarterly"  # quarterly wins over yearly
+        assert _determine_frequency("Inflation Rate YoY") == "yearly"
+        assert _determine_frequency("Weekly Jobless Claims") == "weekly"
+        assert _determine_frequency("Daily Oil Output") == "daily"
+        assert _determine_frequency("Unemployment Rate") == "monthly"
+    
+    def test_parse_headline_indicators(self):
+        """Test that parse_headline_indicators picks GDP, inflation and unemployment in one pass."""
+        from parsers.macro import parse_headline_indicators
+        
+        html = """
+        <table><tr><th>United States</th><th>Value</th></tr>
+            <tr><td>GDP Growth Rate</td><td>2.4%</td></tr>
+            <tr><td>CPI Inflation</td><td>3.1%</td></tr>
+            <tr><td>Jobless Rate</td><td>3.9%</td></tr></table>
+        """
+        
+        result = parse_headline_indicators(html)
+        assert result["US"] == {"gdp": 2.4, "inflation": 3.1, "unemployment": 3.9}
+        assert result["JP"] == {"gdp": None, "inflation": None, "unemployment": None}
 
 
 class TestHeadlinesParser:
@@ -404,6 +602,94 @@ class TestHeadlinesParser:
         
         result = parse_headlines(empty_html)
         assert result == []
+    
+    def test_parse_headlines_class_hints_case_insensitive(self):
+        """Test that headline class hints match as case-insensitive substrings."""
+        from parsers.headlines import parse_headlines
+        
+        html = (
+            '<html><body>'
+            '<div class="main-headline-block"><a href="/news/a">Stocks rally on strong jobs data</a></div>'
+            '<div class="News-Item"><a href="/news/b">Oil falls as supply rises again</a></div>'
+            '</body></html>'
+        )
+        titles = [article.title for article in parse_headlines(html)]
+        assert titles == ["Stocks rally on strong jobs data", "Oil falls as supply rises again"]
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("2024-01-15", (2024, 1, 15, 0, 0)),
+        ("2024-01-15T14:30:00", (2024, 1, 15, 14, 30)),
+        ("2024-01-15 14:30:00", (2024, 1, 15, 14, 30)),
+        ("2024-1-5T09:05:07", (2024, 1, 5, 9, 5)),
+        ("January 15, 2024", (2024, 1, 15, 0, 0)),
+        ("January 15, 2024 14:30", (2024, 1, 15, 14, 30)),
+        ("15 January 2024", (2024, 1, 15, 0, 0)),
+        ("15 january 2024 14:30", (2024, 1, 15, 14, 30)),
+        ("03/04/2024", (2024, 3, 4, 0, 0)),
+        ("01/15/2024 14:30", (2024, 1, 15, 14, 30)),
+        ("15/01/2024", (2024, 1, 15, 0, 0)),
+        ("15-01-2024 14:30", (2024, 1, 15, 14, 30)),
+    ])
+    def test_parse_datetime_absolute_shapes(self, value, expected):
+        """Test each absolute date shape, including month-first vs day-first slashes."""
+        from parsers.headlines import _parse_datetime
+        
+        dt = _parse_datetime(value)
+        assert dt is not None
+        assert (dt.year, dt.month, dt.day, dt.hour, dt.minute) == expected
+        assert dt.tzinfo is None
+    
+    def test_parse_datetime_iso_with_timezone(self):
+        """Test that an ISO timestamp with an offset keeps its timezone."""
+        from datetime import datetime, timedelta, timezone
+        from parsers.headlines import _parse_datetime
+        
+        assert _parse_datetime("2024-01-15T14:30:00+02:00") == datetime(
+            2024, 1, 15, 14, 30, tzinfo=timezone(timedelta(hours=2))
+        )
+        assert _parse_datetime("2024-01-15T14:30:00Z") == datetime(
+            2024, 1, 15, 14, 30, tzinfo=timezone.utc
+        )
+    
+    @pytest.mark.parametrize("value", [
+        "2024-02-30",
+        "2024-13-01T00:00:00",
+        "2024-01-15T25:00:00+00:00",
+        "February 30, 2024",
+        "31 Foo 2024",
+        "13/13/2024",
+        "32-01-2024",
+        "100000000 days ago",
+        "",
+        "not a date",
+    ])
+    def test_parse_datetime_invalid_returns_none(self, value):
+        """Test that out-of-range or unknown dates return None."""
+        from parsers.headlines import _parse_datetime
+        
+        assert _parse_datetime(value) is None
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("30 minutes ago", (2024, 3, 1, 10, 15)),
+        ("2 hours ago", (2024, 3, 1, 8, 0)),
+        ("12 hours ago", (2024, 2, 29, 22, 0)),
+        ("Yesterday", (2024, 2, 29, 0, 0)),
+        ("3 days ago", (2024, 2, 27, 0, 0)),
+    ])
+    def test_parse_datetime_relative_across_month_boundary(self, monkeypatch, value, expected):
+        """Test relative times counted back from the first of a month."""
+        from datetime import datetime
+        import parsers.headlines as headlines
+        
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2024, 3, 1, 10, 45, 30)
+        
+        monkeypatch.setattr(headlines, "datetime", FixedDatetime)
+        dt = headlines._parse_datetime(value)
+        assert (dt.year, dt.month, dt.day, dt.hour, dt.minute) == expected
+        assert dt.second == 0
 
 
 class TestModels:
@@ -473,6 +759,29 @@ class TestModels:
         assert instrument.bid is None
         assert instrument.ask is None
     
+    def test_market_instrument_build_trusted(self):
+        """Test that trusted construction skips validation but keeps symbol casing."""
+        from models import MarketInstrument, MarketCategory
+
+        instrument = MarketInstrument.build_trusted(
+            symbol="eurusd",
+            name="Euro/US Dollar",
+            value=1.085,
+            pct_change=150.0,
+            category=MarketCategory.FOREX,
+        )
+
+        assert instrument.symbol == "EURUSD"
+        assert instrument.pct_change == 150.0
+        assert instrument.timestamp is not None
+
+    def test_parsed_records_are_frozen(self, sample_market_instrument):
+        """Test that parsed records reject attribute assignment."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            sample_market_instrument.value = 1.0
+
     def test_macro_indicator_valid(self, sample_macro_indicator):
         """Test valid macro indicator creation."""
         from models import MacroIndicator, CountryCode
@@ -582,6 +891,40 @@ class TestModels:
         assert "macroeconomics" in summary
         assert "news" in summary
     
+    def test_write_output_json_matches_model_dump(
+        self,
+        tmp_path,
+        sample_market_instrument,
+        sample_macro_indicator,
+        sample_news_article,
+    ):
+        """Test that the streaming JSON writer produces the same document as model_dump()."""
+        import importlib.util
+        import json
+        import orjson
+        from models import TradingEconomicsOutput
+        
+        spec = importlib.util.spec_from_file_location(
+            "scraper_main", Path(__file__).parent.parent / "__main__.py"
+        )
+        scraper_main = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(scraper_main)
+        
+        output = TradingEconomicsOutput(
+            forex=[sample_market_instrument, sample_market_instrument],
+            macro_us=[sample_macro_indicator],
+            market_headlines=[sample_news_article],
+            metadata={"scraped_at": "2024-01-25T14:30:00", "data_sources": ["forex", "macro"]},
+            errors=["news: timeout"],
+        )
+        path = tmp_path / "output.json"
+        scraper_main.write_output_json(output, str(path))
+        
+        written = json.loads(path.read_text(encoding="utf-8"))
+        assert written == orjson.loads(orjson.dumps(output.model_dump()))
+        assert written["indices"] == []
+        assert list(written) == list(TradingEconomicsOutput.model_fields)
+    
     def test_trading_economics_output_with_data(self, sample_market_instrument):
         """Test output with actual data."""
         from models import TradingEconomicsOutput
@@ -592,6 +935,18 @@ class TestModels:
         
         assert output.total_items() == 1
         assert len(output.forex) == 1
+    
+    def test_trading_economics_output_to_json(self, sample_market_instrument):
+        """Test JSON serialization of the output container."""
+        import json
+        from models import TradingEconomicsOutput
+        
+        output = TradingEconomicsOutput(forex=[sample_market_instrument])
+        data = json.loads(output.to_json())
+        
+        assert data["forex"][0]["symbol"] == sample_market_instrument.symbol
+        assert data["forex"][0]["category"] == "forex"
+        assert data == json.loads(output.model_dump_json())
 
 
 class TestMarketCategory:
@@ -654,6 +1009,85 @@ class TestScraperUtilities:
         from parsers.markets import parse_commodities
         
         pass
+    
+    def test_build_request_headers_read_only(self):
+        """Test that the shared header sets cannot be mutated by callers."""
+        from scraper import build_request_headers
+        
+        headers = build_request_headers()
+        assert headers["User-Agent"]
+        with pytest.raises(TypeError):
+            headers["Referer"] = "https://example.com"
+        
+        extended = {**headers, "Referer": "https://example.com"}
+        assert "Referer" not in headers
+        assert extended["User-Agent"] == headers["User-Agent"]
+    
+    def test_parse_robots_content(self):
+        """Test the robots.txt regex sweep over raw bytes."""
+        from scraper import _parse_robots_content
+        
+        content = (
+            "# comment line\r\n"
+            "User-Agent: *\r\n"
+            "  DISALLOW: /Private/  \r\n"
+            "\tallow:/public\r\n"
+            "Disallow:\r\n"
+            "Disallow: /café\r\n"
+            "Crawl-Delay : 2.5\r\n"
+        ).encode("utf-8")
+        
+        robots = _parse_robots_content(content)
+        assert robots.disallowed == {"/private/", "/café"}
+        assert robots.allowed == {"/public"}
+        assert robots.crawl_delay == 2.5
+        assert not robots.is_allowed("/café/menu", "default")
+        assert robots.is_allowed("/public/page", "default")
+    
+    def test_request_with_retry(self, monkeypatch):
+        """Test that 5xx responses are retried with backoff until success or the retry limit."""
+        import asyncio
+        import httpx
+        import scraper
+        
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+        
+        monkeypatch.setattr(scraper.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(scraper, "RETRY_CONFIG", {"max_retries": 3, "backoff_factor": 1.0})
+        
+        async def run(statuses):
+            calls = []
+            
+            def handler(request):
+                calls.append(request.url)
+                return httpx.Response(statuses[min(len(calls), len(statuses)) - 1], request=request)
+            
+            client = scraper.ScrapingClient()
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                return await client._request_with_retry("https://example.com/page", {}), calls
+            except scraper.RequestError as e:
+                return e, calls
+            finally:
+                await client._client.aclose()
+        
+        response, calls = asyncio.run(run([503, 200]))
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert len(sleeps) == 1 and 0.5 <= sleeps[0] <= 1.5
+        
+        sleeps.clear()
+        error, calls = asyncio.run(run([503]))
+        assert len(calls) == 4
+        assert len(sleeps) == 3
+        assert str(error) == "Failed after 3 retries: https://example.com/page"
+        
+        error, calls = asyncio.run(run([404]))
+        assert len(calls) == 1
+        assert str(error) == "HTTP 404: https://example.com/page"
 
 
 class TestEdgeCases:
@@ -705,6 +1139,30 @@ class TestEdgeCases:
         assert isinstance(data, dict)
         assert data["symbol"] == "EURUSD"
         assert data["value"] == 1.0850
+    
+    @pytest.mark.parametrize("module_name, parser_name, defaults_name", [
+        ("parsers.etfs", "parse_etfs_with_fallback", "DEFAULT_ETFS"),
+        ("parsers.derivatives", "parse_derivatives_with_fallback", "DEFAULT_DERIVATIVES"),
+    ])
+    def test_default_fallback_uses_run_timestamp(self, empty_html, module_name, parser_name, defaults_name):
+        """Test that prebuilt default fallback records are stamped with the current run's timestamp."""
+        import importlib
+        from datetime import datetime
+        from models import set_scrape_timestamp
+        
+        module = importlib.import_module(module_name)
+        parse_with_fallback = getattr(module, parser_name)
+        defaults = getattr(module, defaults_name)
+        
+        run_ts = datetime(2030, 1, 1)
+        set_scrape_timestamp(run_ts)
+        try:
+            result = parse_with_fallback(empty_html, defaults)
+        finally:
+            set_scrape_timestamp(None)
+        
+        assert len(result) == len(defaults)
+        assert all(record.timestamp == run_ts for record in result)
 
 
 if __name__ == "__main__":